@@ -14,8 +14,13 @@ from .state import GameState, Player, PlayResult
 class GameEngine:
     """游戏引擎"""
 
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        Args:
+            rng: 洗牌使用的随机数生成器，传入带种子的实例可复现对局；默认使用全局random
+        """
         self.games: Dict[str, GameState] = {}
+        self.rng = rng if rng is not None else random
 
     def create_game(self, player1_name: str, player2_name: str) -> GameState:
         """创建新游戏"""
@@ -27,8 +32,8 @@ class GameEngine:
         deck2 = create_starter_deck()
 
         # 洗牌
-        random.shuffle(deck1)
-        random.shuffle(deck2)
+        self.rng.shuffle(deck1)
+        self.rng.shuffle(deck2)
 
         # 设置牌库
         player1.deck = deck1
@@ -142,7 +147,7 @@ class GameEngine:
         current = game.current_player
 
         # 检查随从是否可以攻击
-        if attacker not in current.battlefield:
+        if not current.contains_minion(attacker):
             return PlayResult(False, error="Minion not on battlefield")
 
         if not attacker.can_attack:
@@ -212,7 +217,8 @@ class GameEngine:
             if attacker in game.current_player.battlefield:
                 game.current_player.battlefield.remove(attacker)
 
-        return PlayResult(True, "Minion attack completed")
+        return PlayResult(True, "Minion attack completed",
+                          target_died=defender_died, attacker_died=attacker_died)
 
     def _minion_attack_hero(self, attacker: Card, hero, game: GameState) -> PlayResult:
         """随从攻击英雄"""
@@ -230,7 +236,7 @@ class GameEngine:
 
         attacker.can_attack = False
 
-        return PlayResult(True, "Minion attacked hero")
+        return PlayResult(True, "Minion attacked hero", target_died=hero.health <= 0)
 
     def attack_with_hero(self, target) -> PlayResult:
         """英雄攻击"""
@@ -272,7 +278,7 @@ class GameEngine:
         if current.weapon.durability <= 0:
             current.weapon = None
 
-        return PlayResult(True, "Hero attack completed")
+        return PlayResult(True, "Hero attack completed", target_died=target.health <= 0)
 
     def end_turn(self):
         """结束当前回合"""
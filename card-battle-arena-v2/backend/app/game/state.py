@@ -16,6 +16,8 @@ class PlayResult:
     success: bool
     message: str = ""
     error: str = ""
+    target_died: bool = False    # 攻击目标是否阵亡（生命值降到0及以下）
+    attacker_died: bool = False  # 攻击者是否阵亡
 
 
 class Player:
@@ -53,6 +55,14 @@ class Player:
         self.hand.append(card)
         return card
 
+    def contains_minion(self, card: Card) -> bool:
+        """检查随从是否在己方战场上
+
+        按对象身份比较，不调用dataclass生成的逐字段__eq__，
+        同名同属性的两张随从也能正确区分。
+        """
+        return any(minion is card for minion in self.battlefield)
+
     def enforce_hand_limit(self):
         """强制执行手牌上限（7张）"""
         while len(self.hand) > 7:
@@ -3,6 +3,7 @@
 """
 
 import pygame
+from collections import OrderedDict
 from typing import Tuple, Optional
 from app.game.cards import Card
 from app.visualization.design.tokens import DesignTokens
@@ -12,6 +13,12 @@ from app.visualization.font_manager import render_text_safely
 class CardRenderer:
     """组件化卡牌渲染器"""
 
+    # 卡面缓存的最大条目数
+    CACHE_SIZE = 256
+
+    # 影响卡面显示的技能属性
+    _ABILITY_FLAGS = ('taunt', 'divine_shield', 'windfury', 'charge', 'stealth')
+
     def __init__(self):
         """初始化卡牌渲染器"""
         self.tokens = DesignTokens()
@@ -20,6 +27,54 @@ class CardRenderer:
         self.corner_radius = self.tokens.CARD['corner_radius']
         self.border_width = self.tokens.CARD['border_width']
 
+        # 已光栅化的卡面，按显示相关属性做LRU缓存
+        self._surface_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+    def _card_key(self, card: Card, selected: bool, hover: bool) -> tuple:
+        """卡面缓存键：包含所有影响卡面显示的属性"""
+        return (card.id, card.name, card.cost, card.attack, card.health, card.card_type,
+                *(getattr(card, flag, False) for flag in self._ABILITY_FLAGS),
+                selected, hover)
+
+    def get_card_surface(self, card: Card, selected: bool = False,
+                         hover: bool = False) -> pygame.Surface:
+        """
+        获取卡牌的光栅化卡面
+
+        首次请求时把卡牌绘制到独立surface并缓存，之后相同显示状态直接复用。
+
+        Args:
+            card: 要渲染的卡牌
+            selected: 是否选中
+            hover: 是否悬停
+
+        Returns:
+            卡面surface
+        """
+        key = self._card_key(card, selected, hover)
+        cache = self._surface_cache
+
+        card_surface = cache.get(key)
+        if card_surface is not None:
+            cache.move_to_end(key)
+            return card_surface
+
+        card_surface = pygame.Surface((self.card_width, self.card_height), pygame.SRCALPHA)
+        self.render_card_background(card_surface, (0, 0), selected, hover)
+        self.render_card_content(card_surface, card, (0, 0))
+        self.render_card_border(card_surface, card, (0, 0), selected, hover)
+        if pygame.display.get_surface() is not None:
+            card_surface = card_surface.convert_alpha()
+
+        cache[key] = card_surface
+        if len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
+        return card_surface
+
+    def clear_cache(self) -> None:
+        """清空卡面缓存"""
+        self._surface_cache.clear()
+
     def render_card(self, card: Card, position: Tuple[int, int],
                    surface: pygame.Surface, selected: bool = False,
                    hover: bool = False) -> None:
@@ -33,16 +88,7 @@ class CardRenderer:
             selected: 是否选中
             hover: 是否悬停
         """
-        x, y = position
-
-        # 渲染卡牌背景
-        self.render_card_background(surface, position, selected, hover)
-
-        # 渲染卡牌内容
-        self.render_card_content(surface, card, position)
-
-        # 渲染卡牌边框
-        self.render_card_border(surface, card, position, selected, hover)
+        surface.blit(self.get_card_surface(card, selected, hover), position)
 
     def render_card_background(self, surface: pygame.Surface,
                              position: Tuple[int, int],
@@ -128,18 +174,18 @@ class CardRenderer:
         try:
             text_surface = render_text_safely(display_name, 16, self.tokens.COLORS['card']['text'])
             surface.blit(text_surface, (x + 8, y + 8))
-        except:
+        except Exception:
             # 如果安全渲染失败，显示卡牌ID
             try:
                 id_surface = render_text_safely(f"Card {card.id}", 16, self.tokens.COLORS['card']['text'])
                 surface.blit(id_surface, (x + 8, y + 8))
-            except:
+            except Exception:
                 # 最后的降级选项
                 try:
                     font = pygame.font.Font(None, 16)
                     text = font.render(f"C{card.id}", True, self.tokens.COLORS['card']['text'])
                     surface.blit(text, (x + 8, y + 8))
-                except:
+                except Exception:
                     pass  # 如果所有渲染都失败，跳过名称显示
 
     def render_card_cost(self, surface: pygame.Surface,
@@ -163,7 +209,7 @@ class CardRenderer:
                 cost_text = font.render(str(card.cost), True, (255, 255, 255))
                 cost_rect = cost_text.get_rect(center=cost_center)
                 surface.blit(cost_text, cost_rect)
-            except:
+            except Exception:
                 pass  # 如果所有渲染都失败，跳过费用显示
 
     def render_card_stats(self, surface: pygame.Surface,
@@ -192,7 +238,7 @@ class CardRenderer:
                 health_color = self.get_health_color(card.health)
                 health_text = font.render(str(card.health), True, health_color)
                 surface.blit(health_text, (x + self.card_width - 25, y + self.card_height - 25))
-            except:
+            except Exception:
                 pass  # 如果所有渲染都失败，跳过属性显示
 
     def render_card_abilities(self, surface: pygame.Surface,
@@ -221,7 +267,7 @@ class CardRenderer:
                     skill_surface = render_text_safely(icon, 14, color)
                     surface.blit(skill_surface, (skill_x + skill_index * skill_spacing, skill_y))
                     skill_index += 1
-                except:
+                except Exception:
                     # 如果emoji渲染失败，使用文字替代
                     text_map = {
                         'taunt': 'T',
@@ -234,14 +280,14 @@ class CardRenderer:
                         fallback_surface = render_text_safely(text_map.get(skill, '?'), 14, color)
                         surface.blit(fallback_surface, (skill_x + skill_index * skill_spacing, skill_y))
                         skill_index += 1
-                    except:
+                    except Exception:
                         # 最后的降级选项
                         try:
                             font = pygame.font.Font(None, 14)
                             text = font.render(text_map.get(skill, '?'), True, color)
                             surface.blit(text, (skill_x + skill_index * skill_spacing, skill_y))
                             skill_index += 1
-                        except:
+                        except Exception:
                             pass  # 如果所有渲染都失败，跳过该技能图标
 
     def render_card_border(self, surface: pygame.Surface,
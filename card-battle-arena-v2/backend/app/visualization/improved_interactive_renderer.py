@@ -99,19 +99,19 @@ class ImprovedInteractiveRenderer:
         regions = self.window_manager.get_layout_regions()
 
         # 创建改进的UI组件，使用动态区域配置
-        self.hud = GameHUD(regions['hud'][:2], regions['hud'][2:])
+        self.hud = GameHUD(regions['hud'].topleft, regions['hud'].size)
 
         # 改进的手牌区域 - 使用动态布局的高度 (240px)
-        self.player_hand = HandArea(regions['hand_area'][:2], regions['hand_area'][2:])
+        self.player_hand = HandArea(regions['hand_area'].topleft, regions['hand_area'].size)
 
         # 战场区域位置调整
         self.opponent_battlefield = BattlefieldZone(
-            regions['opponent_battlefield'][:2],
-            regions['opponent_battlefield'][2:]
+            regions['opponent_battlefield'].topleft,
+            regions['opponent_battlefield'].size
         )
         self.player_battlefield = BattlefieldZone(
-            regions['player_battlefield'][:2],
-            regions['player_battlefield'][2:]
+            regions['player_battlefield'].topleft,
+            regions['player_battlefield'].size
         )
 
         # 添加游戏控制区域
@@ -596,10 +596,9 @@ class ImprovedInteractiveRenderer:
             self.dragging_card.render(self.screen)
 
         # 渲染目标选择高亮
+        # 仅在目标选择进行中调用；目前只有手牌组件可作为目标，直接传入无需复制列表
         if self.target_selector and self.target_selector.is_selecting:
-            all_target_components = []
-            all_target_components.extend(self.player_hand.card_components)
-            self.target_selector.render_highlights(self.screen, all_target_components)
+            self.target_selector.render_highlights(self.screen, self.player_hand.card_components)
 
         # 显示调试信息
         self._render_debug_info()
@@ -133,6 +133,70 @@ class TestCardClickInteraction:
         card_component.deselect()
         assert card_component.is_selected == False
 
+    def test_selected_target_keeps_thick_border(self):
+        """
+        测试同时选中和目标高亮的卡牌使用目标背景色，边框仍按选中加粗
+        """
+        from app.visualization.ui.card_component import InteractiveCard
+
+        test_card = Card(
+            id=1,
+            name="测试卡牌",
+            cost=3,
+            card_type=CardType.MINION,
+            attack=4,
+            health=5
+        )
+
+        card_component = InteractiveCard(test_card, position=(100, 100))
+        card_component.select()
+        card_component.set_as_target(True)
+        surface = pygame.Surface((400, 400))
+        card_component.render(surface)
+
+        rect = card_component.get_current_rect()
+        # 第3像素列属于3px边框，2px边框时这里是背景色
+        assert surface.get_at((rect.left + 2, rect.centery))[:3] == (0, 0, 0)
+        assert surface.get_at((rect.left + 3, rect.centery))[:3] == card_component.target_color
+
+    def test_hover_shadow_skipped_when_selected(self):
+        """
+        测试选中或目标高亮的卡牌在悬停时不绘制阴影
+        """
+        from app.visualization.ui.card_component import InteractiveCard
+
+        test_card = Card(
+            id=1,
+            name="测试卡牌",
+            cost=3,
+            card_type=CardType.MINION,
+            attack=4,
+            health=5
+        )
+
+        card_component = InteractiveCard(test_card, position=(100, 100))
+        surface = pygame.Surface((400, 400))
+        shadow_point = (card_component.rect.right + 1, card_component.rect.centery)
+
+        # 仅悬停时绘制阴影
+        card_component.is_hovered = True
+        card_component.render(surface)
+        assert surface.get_at(shadow_point)[:3] == (100, 100, 100)
+
+        # 悬停且选中时跳过阴影
+        surface.fill((0, 0, 0))
+        card_component.select()
+        card_component.render(surface)
+        shadow_point = (card_component.rect.right + 1, card_component.rect.centery)
+        assert surface.get_at(shadow_point)[:3] == (0, 0, 0)
+
+        # 悬停且为目标时跳过阴影
+        surface.fill((0, 0, 0))
+        card_component.deselect()
+        card_component.set_as_target(True)
+        card_component.render(surface)
+        assert surface.get_at(shadow_point)[:3] == (0, 0, 0)
+
 
 class TestDragAndDropInteraction:
     """拖拽交互功能测试"""
@@ -307,6 +371,48 @@ class TestTargetSelectionSystem:
         assert len(valid_targets) >= 1  # 至少包含对手英雄
         assert player2.hero in valid_targets
 
+    def test_selection_info_target_types(self):
+        """
+        测试选择信息中的目标分类统计
+        """
+        from app.visualization.ui.target_selector import TargetSelector
+
+        player1 = Player(1, "玩家1")
+        player2 = Player(2, "玩家2")
+        game = GameState(player1, player2)
+        selector = TargetSelector(game)
+
+        enemy_minion = Card(id=2, name="敌方随从", cost=2, card_type=CardType.MINION, attack=2, health=2)
+        player2.battlefield.append(enemy_minion)
+        spell = Card(id=3, name="火球术", cost=4, card_type=CardType.SPELL, attack=0, health=0)
+
+        selector.start_target_selection("spell", spell)
+        info = selector.get_selection_info()
+
+        assert info['valid_targets_count'] == 2
+        assert info['valid_target_types'] == {'heroes': 1, 'minions': 1, 'friendly': 0, 'enemy': 2}
+        assert selector.get_targets_by_type('minion') == [enemy_minion]
+        assert selector.can_target_enemy_hero()
+        assert selector.can_target_enemy_minions()
+
+        # 取消选择后分类缓存随目标列表一起清空
+        selector.cancel_selection()
+        assert selector.get_selection_info()['valid_target_types']['enemy'] == 0
+        assert not selector.can_target_enemy_hero()
+        assert not selector.can_target_enemy_minions()
+
+
+    def test_component_target_uses_hero_rect(self):
+        """
+        测试只有hero_rect、没有rect的英雄组件也能取到目标矩形
+        """
+        from app.visualization.ui.target_selector import TargetSelector
+
+        player = Player(1, "玩家1")
+        hero_rect = pygame.Rect(10, 10, 100, 100)
+        component = Mock(spec=['hero', 'hero_rect'], hero=player.hero, hero_rect=hero_rect)
+
+        assert TargetSelector._get_component_target(component) == (player.hero, hero_rect)
 
 class TestGameStateUISync:
     """游戏状态UI同步测试"""
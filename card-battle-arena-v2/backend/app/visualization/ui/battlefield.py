@@ -276,7 +276,6 @@ class BattlefieldZone:
             surface: 目标surface
         """
         try:
-            title_font = pygame.font.Font(None, 24)
             title_text = f"战场 ({len(self.minions)}/{self.max_minions})"
             title_surface = render_text_safely(title_text, 24, (0, 100, 0))
             title_rect = title_surface.get_rect(centerx=self.rect.centerx, y=self.rect.y - 25)
@@ -5,7 +5,7 @@
 """
 
 import pygame
-from typing import Tuple, Optional, Callable
+from typing import Tuple, Optional, Callable, Dict
 from app.game.cards import Card
 from app.visualization.font_manager import get_best_font, render_text_safely
 
@@ -17,6 +17,14 @@ class InteractiveCard:
     支持点击、悬停、拖拽等交互功能的卡牌UI组件
     """
 
+    # 各交互状态的渲染参数: 状态 -> (背景色, 边框宽度)
+    _STATE_PARAMS: Dict[str, Tuple[Tuple[int, int, int], int]] = {
+        "normal": ((255, 255, 255), 2),
+        "hover": ((255, 255, 200), 2),
+        "selected": ((200, 200, 255), 3),
+        "target": ((255, 200, 200), 2),
+    }
+
     def __init__(self,
                  card: Card,
                  position: Tuple[int, int],
@@ -34,6 +42,7 @@ class InteractiveCard:
             on_drag_end: 拖拽结束回调函数
         """
         self.card = card
+        self._has_stats = self._card_has_stats(card)
         self.position = position
         self.size = size
         self.on_click = on_click
@@ -56,11 +65,11 @@ class InteractiveCard:
         self.selected_offset = 10
 
         # 颜色定义
-        self.bg_color = (255, 255, 255)  # 白色背景
-        self.border_color = (0, 0, 0)    # 黑色边框
-        self.hover_color = (255, 255, 200)  # 悬停背景色
-        self.selected_color = (200, 200, 255)  # 选中背景色
-        self.target_color = (255, 200, 200)    # 目标高亮色
+        self.bg_color = self._STATE_PARAMS["normal"][0]          # 白色背景
+        self.border_color = (0, 0, 0)                             # 黑色边框
+        self.hover_color = self._STATE_PARAMS["hover"][0]         # 悬停背景色
+        self.selected_color = self._STATE_PARAMS["selected"][0]   # 选中背景色
+        self.target_color = self._STATE_PARAMS["target"][0]       # 目标高亮色
 
         # 字体（延迟加载）
         self.font = None
@@ -220,6 +229,21 @@ class InteractiveCard:
         """获取当前矩形区域"""
         return pygame.Rect(self.current_position, self.size)
 
+    def _get_state_key(self) -> str:
+        """
+        获取当前交互状态键（目标高亮 > 选中 > 悬停 > 普通）
+
+        Returns:
+            str: _STATE_PARAMS 中的状态键
+        """
+        if self.is_target_highlighted:
+            return "target"
+        if self.is_selected:
+            return "selected"
+        if self.is_hovered:
+            return "hover"
+        return "normal"
+
     def render(self, surface: pygame.Surface):
         """
         渲染卡牌
@@ -235,33 +259,24 @@ class InteractiveCard:
 
         current_rect = self.get_current_rect()
 
-        # 选择背景颜色
-        if self.is_target_highlighted:
-            bg_color = self.target_color
-        elif self.is_selected:
-            bg_color = self.selected_color
-        elif self.is_hovered:
-            bg_color = self.hover_color
-        else:
-            bg_color = self.bg_color
+        # 按交互状态查表获取渲染参数
+        state = self._get_state_key()
+        bg_color, border_width = self._STATE_PARAMS[state]
+        if self.is_selected:
+            # 选中且为目标时背景取目标色，边框仍按选中加粗
+            border_width = self._STATE_PARAMS["selected"][1]
+
+        # 仅普通悬停状态绘制阴影，选中/目标高亮的卡牌已有高亮背景，跳过阴影；
+        # 阴影先画，再由主体覆盖
+        if state == "hover":
+            pygame.draw.rect(surface, (100, 100, 100), current_rect.move(3, 3), border_radius=8)
 
         # 绘制卡牌背景
         pygame.draw.rect(surface, bg_color, current_rect, border_radius=8)
 
         # 绘制边框
-        border_width = 3 if self.is_selected else 2
         pygame.draw.rect(surface, self.border_color, current_rect, border_width, border_radius=8)
 
-        # 如果悬停，添加阴影效果
-        if self.is_hovered:
-            shadow_rect = current_rect.copy()
-            shadow_rect.x += 3
-            shadow_rect.y += 3
-            pygame.draw.rect(surface, (100, 100, 100), shadow_rect, border_radius=8)
-            # 重新绘制主体以覆盖阴影的一部分
-            pygame.draw.rect(surface, bg_color, current_rect, border_radius=8)
-            pygame.draw.rect(surface, self.border_color, current_rect, border_width, border_radius=8)
-
         # 渲染卡牌内容
         self._render_card_content(surface, current_rect)
 
@@ -293,7 +308,7 @@ class InteractiveCard:
             surface.blit(type_surface, type_rect)
 
             # 攻击力和生命值（如果是随从或武器）
-            if hasattr(self.card, 'attack') and hasattr(self.card, 'health'):
+            if self._has_stats:
                 stats_text = f"{self.card.attack}/{self.card.health}"
                 stats_surface = render_text_safely(stats_text, 16, (255, 0, 0))
                 stats_rect = stats_surface.get_rect(bottomright=(rect.right - 5, rect.bottom - 5))
@@ -317,6 +332,20 @@ class InteractiveCard:
             card: 新的卡牌数据
         """
         self.card = card
+        self._has_stats = self._card_has_stats(card)
+
+    @staticmethod
+    def _card_has_stats(card: Card) -> bool:
+        """
+        检查卡牌是否带有攻击力/生命值（构造或更换卡牌时计算一次）
+
+        Args:
+            card: 卡牌数据
+
+        Returns:
+            bool: 是否显示身材
+        """
+        return hasattr(card, 'attack') and hasattr(card, 'health')
 
     def get_info(self) -> dict:
         """
@@ -94,8 +94,8 @@ class HandArea:
         """
         for i, component in enumerate(self.card_components):
             if component.card == card:
-                del self.card_components[i]
-                # 重新排列剩余卡牌位置
+                self.card_components.pop(i)
+                # 重新排列剩余卡牌位置（保持手牌顺序）
                 self._rearrange_cards()
                 return True
         return False
@@ -111,8 +111,7 @@ class HandArea:
             Optional[Card]: 被移除的卡牌，如果索引无效则返回None
         """
         if 0 <= index < len(self.card_components):
-            card = self.card_components[index].card
-            del self.card_components[index]
+            card = self.card_components.pop(index).card
             self._rearrange_cards()
             return card
         return None
@@ -201,12 +200,21 @@ class HandArea:
         return (x, y)
 
     def _rearrange_cards(self):
-        """重新排列所有卡牌位置"""
+        """
+        重新排列所有卡牌位置
+
+        起始位置只计算一次，并原地更新已有的矩形，避免逐张重建pygame.Rect。
+        """
+        if not self.card_components:
+            return
+
+        start_x, y = self._calculate_card_position(0)
+        step = self.card_width + self.card_spacing
         for i, component in enumerate(self.card_components):
-            new_position = self._calculate_card_position(i)
+            new_position = (start_x + i * step, y)
             component.position = new_position
             component.current_position = new_position
-            component.rect = pygame.Rect(new_position, (self.card_width, self.card_height))
+            component.rect.topleft = new_position
 
     def handle_mouse_motion(self, point: Tuple[int, int]) -> bool:
         """
@@ -286,7 +294,6 @@ class HandArea:
             surface: 目标surface
         """
         try:
-            title_font = pygame.font.Font(None, 20)
             title_text = f"手牌 ({len(self.card_components)}/{self.max_cards})"
             title_surface = render_text_safely(title_text, 20, (50, 50, 150))
             title_rect = title_surface.get_rect(centerx=self.rect.centerx, y=self.rect.y - 20)
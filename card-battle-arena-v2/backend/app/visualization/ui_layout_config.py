@@ -3,7 +3,9 @@ UI布局配置文件
 基于UI布局分析与改进方案的具体实施参数
 """
 
-from typing import Dict, Tuple
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Dict, Optional, Tuple
 
 # 主要UI布局配置
 UI_LAYOUT_CONFIG = {
@@ -226,23 +228,38 @@ COLOR_THEME = {
     }
 }
 
-def get_region_config(region_name: str) -> Dict:
+@dataclass(frozen=True, slots=True)
+class RegionConfig:
+    """区域布局配置（导入时由UI_LAYOUT_CONFIG构建，只读）"""
+    position: Tuple[int, int]
+    size: Tuple[int, int]
+    background_color: Tuple[int, int, int]
+    border_color: Tuple[int, int, int]
+    border_width: int
+    corner_radius: int = 0
+
+# 区域配置对象表（UI_LAYOUT_CONFIG 字典保留用于序列化和整体遍历）
+REGIONS: Dict[str, RegionConfig] = {
+    name: RegionConfig(**config) for name, config in UI_LAYOUT_CONFIG["regions"].items()
+}
+
+def get_region_config(region_name: str) -> Optional[RegionConfig]:
     """获取指定区域的配置"""
-    return UI_LAYOUT_CONFIG["regions"].get(region_name, {})
+    return REGIONS.get(region_name)
 
 def get_component_config(component_name: str) -> Dict:
     """获取指定组件的配置"""
     return UI_LAYOUT_CONFIG["components"].get(component_name, {})
 
-def validate_layout(layout_config: Dict) -> bool:
-    """验证布局配置是否符合标准"""
-    validation = UI_LAYOUT_CONFIG["validation"]
+def _check_layout(layout_config: Dict) -> bool:
+    """检查布局配置中手牌区域能否容纳卡牌及其操作空间"""
+    validation = layout_config["validation"]
 
     # 检查手牌区域高度
-    hand_config = get_region_config("player_hand")
+    hand_config = layout_config["regions"].get("player_hand")
     if hand_config:
         hand_height = hand_config["size"][1]
-        card_height = UI_LAYOUT_CONFIG["card"]["dimensions"][1]
+        card_height = layout_config["card"]["dimensions"][1]
         min_space = validation["min_card_space"]
 
         if hand_height < card_height + min_space:
@@ -251,14 +268,20 @@ def validate_layout(layout_config: Dict) -> bool:
 
     return True
 
+def validate_layout(layout_config: Dict) -> bool:
+    """验证布局配置是否符合标准（默认配置直接返回导入时的校验结果）"""
+    if layout_config is UI_LAYOUT_CONFIG:
+        return _LAYOUT_VALID
+    return _check_layout(layout_config)
+
 def calculate_card_positions(card_count: int, region_name: str) -> list:
     """计算卡牌在指定区域的位置"""
     region_config = get_region_config(region_name)
     if not region_config:
         return []
 
-    region_pos = region_config["position"]
-    region_size = region_config["size"]
+    region_pos = region_config.position
+    region_size = region_config.size
     card_config = UI_LAYOUT_CONFIG["card"]
     card_dims = card_config["dimensions"]
     spacing = card_config["hand"]["spacing"]["default"]
@@ -276,13 +299,13 @@ def calculate_card_positions(card_count: int, region_name: str) -> list:
     start_x = region_pos[0] + (region_size[0] - total_width) // 2
     start_y = region_pos[1] + (region_size[1] - card_dims[1]) // 2
 
-    positions = []
-    for i in range(card_count):
-        x = start_x + i * (card_dims[0] + spacing)
-        y = start_y
-        positions.append((x, y))
+    # range按步长直接生成X坐标，无需逐张计算
+    step = card_dims[0] + spacing
+    xs = range(start_x, start_x + card_count * step, step)
+    return list(zip(xs, repeat(start_y, card_count)))
 
-    return positions
+# 默认配置是静态的，导入时校验一次
+_LAYOUT_VALID = _check_layout(UI_LAYOUT_CONFIG)
 
 if __name__ == "__main__":
     # 验证配置
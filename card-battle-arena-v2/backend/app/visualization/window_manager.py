@@ -6,11 +6,13 @@
 """
 
 import pygame
+from functools import lru_cache
+from itertools import repeat
 from typing import Dict, Tuple, Optional, Any
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class WindowConfig:
     """窗口配置类"""
     width: int = 1200
@@ -21,7 +23,7 @@ class WindowConfig:
     resizable: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class LayoutConfig:
     """布局配置类"""
     # 区域高度定义 (统一解决冲突)
@@ -41,6 +43,46 @@ class LayoutConfig:
     card_height: int = 160
 
 
+@lru_cache(maxsize=64)
+def _calc_positions(card_count: int, region_x: int, region_y: int,
+                    region_width: int, region_height: int,
+                    card_width: int, card_height: int,
+                    spacing: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    计算一排卡牌的位置（纯函数，按完整几何参数缓存）
+
+    缓存键包含区域和卡牌的全部几何参数，窗口尺寸或布局变化会自然命中新的键，
+    无需手动失效。
+
+    Args:
+        card_count: 卡牌数量
+        region_x, region_y, region_width, region_height: 区域矩形
+        card_width, card_height: 卡牌尺寸
+        spacing: 默认卡牌间距
+
+    Returns:
+        Tuple[Tuple[int, int], ...]: 卡牌位置 ((x, y), ...)
+    """
+    # 计算总宽度
+    total_width = card_count * card_width + (card_count - 1) * spacing
+
+    # 如果总宽度超过区域宽度，仅在本次计算中收紧间距（不修改共享的layout_config）
+    if total_width > region_width and card_count > 1:
+        spacing = max(10, (region_width - card_count * card_width) // (card_count - 1))
+        total_width = card_count * card_width + (card_count - 1) * spacing
+
+    # 计算起始X坐标（居中对齐）
+    start_x = region_x + (region_width - total_width) // 2
+
+    # 计算Y坐标（垂直居中）
+    start_y = region_y + (region_height - card_height) // 2
+
+    # 生成所有卡牌位置（range按步长直接生成X坐标，无需逐张计算）
+    step = card_width + spacing
+    xs = range(start_x, start_x + card_count * step, step)
+    return tuple(zip(xs, repeat(start_y, card_count)))
+
+
 class WindowManager:
     """
     动态窗口配置管理器
@@ -56,7 +98,6 @@ class WindowManager:
             window_config: 窗口配置，为None时使用默认配置
         """
         self.window_config = window_config or WindowConfig()
-        self.layout_config = LayoutConfig()
 
         # Pygame相关
         self.screen = None
@@ -66,6 +107,42 @@ class WindowManager:
         self._layout_cache: Dict[str, Any] = {}
         self._cache_valid = False
 
+        # 设置布局配置，同时计算布局所需的最小窗口高度（只依赖layout_config，与窗口尺寸无关）
+        self.layout_config = LayoutConfig()
+
+    @property
+    def layout_config(self) -> LayoutConfig:
+        """
+        布局配置
+
+        需要修改字段时使用 update_layout()，以便重新计算最小高度并失效布局缓存。
+        """
+        return self._layout_config
+
+    @layout_config.setter
+    def layout_config(self, config: LayoutConfig):
+        self._layout_config = config
+        self._on_layout_changed()
+
+    def update_layout(self, **fields):
+        """
+        修改布局配置字段
+
+        Args:
+            **fields: LayoutConfig 字段名到新值的映射
+
+        Raises:
+            AttributeError: 字段名不属于 LayoutConfig
+        """
+        for name, value in fields.items():
+            setattr(self._layout_config, name, value)
+        self._on_layout_changed()
+
+    def _on_layout_changed(self):
+        """布局配置变化后重新计算最小高度，并强制重新计算布局"""
+        self._min_required_height = self._compute_min_required_height()
+        self._cache_valid = False
+
     def create_window(self) -> bool:
         """
         创建游戏窗口
@@ -74,7 +151,8 @@ class WindowManager:
             bool: 是否成功创建窗口
         """
         try:
-            pygame.init()
+            if not pygame.get_init():
+                pygame.init()
 
             # 设置窗口尺寸
             if self.window_config.fullscreen:
@@ -109,6 +187,12 @@ class WindowManager:
             new_width: 新宽度
             new_height: 新高度
         """
+        # 尺寸未变化时无需重建surface和失效布局缓存
+        # （pygame 2在VIDEORESIZE到达前已调整显示surface，只能和配置的尺寸比较）
+        if self.screen is not None and \
+                (self.window_config.width, self.window_config.height) == (new_width, new_height):
+            return
+
         # 更新窗口配置
         self.window_config.width = new_width
         self.window_config.height = new_height
@@ -124,12 +208,15 @@ class WindowManager:
 
         print(f"🔄 窗口大小已调整: {new_width}x{new_height}")
 
-    def get_layout_regions(self) -> Dict[str, Tuple[int, int, int, int]]:
+    def get_layout_regions(self) -> Dict[str, pygame.Rect]:
         """
         获取所有UI区域的布局配置
 
+        区域在每次尺寸变化后只构建一次pygame.Rect并缓存，调用方应视为只读，
+        需要修改时请先 .copy()。
+
         Returns:
-            Dict[str, Tuple[int, int, int, int]]: 区域名称到 (x, y, width, height) 的映射
+            Dict[str, pygame.Rect]: 区域名称到 Rect(x, y, width, height) 的映射
         """
         if self._cache_valid and 'regions' in self._layout_cache:
             return self._layout_cache['regions']
@@ -139,10 +226,10 @@ class WindowManager:
         l = self.layout_config
 
         # HUD区域 (顶部)
-        regions['hud'] = (0, 0, w, l.hud_height)
+        regions['hud'] = pygame.Rect(0, 0, w, l.hud_height)
 
         # 对手信息区域
-        regions['opponent_info'] = (
+        regions['opponent_info'] = pygame.Rect(
             l.margin,
             l.hud_height + l.spacing,
             w - 2 * l.margin,
@@ -150,7 +237,7 @@ class WindowManager:
         )
 
         # 对手战场区域
-        regions['opponent_battlefield'] = (
+        regions['opponent_battlefield'] = pygame.Rect(
             l.margin,
             l.hud_height + l.opponent_info_height + 2 * l.spacing,
             w - 2 * l.margin,
@@ -160,11 +247,11 @@ class WindowManager:
         # 中央战斗区域 (剩余空间)
         central_y_start = l.hud_height + l.opponent_info_height + l.battlefield_height + 3 * l.spacing
         central_height = h - central_y_start - l.player_info_height - l.hand_area_height - l.controls_height - 4 * l.spacing
-        regions['battle_area'] = (0, central_y_start, w, max(0, central_height))
+        regions['battle_area'] = pygame.Rect(0, central_y_start, w, max(0, central_height))
 
         # 玩家信息区域
         player_info_y = central_y_start + central_height + l.spacing
-        regions['player_info'] = (
+        regions['player_info'] = pygame.Rect(
             l.margin,
             player_info_y,
             w - 2 * l.margin,
@@ -173,7 +260,7 @@ class WindowManager:
 
         # 玩家战场区域
         player_battlefield_y = player_info_y + l.player_info_height + l.spacing
-        regions['player_battlefield'] = (
+        regions['player_battlefield'] = pygame.Rect(
             l.margin,
             player_battlefield_y,
             w - 2 * l.margin,
@@ -182,7 +269,7 @@ class WindowManager:
 
         # 手牌区域
         hand_y = h - l.hand_area_height - l.controls_height - l.spacing
-        regions['hand_area'] = (
+        regions['hand_area'] = pygame.Rect(
             l.margin,
             hand_y,
             w - 2 * l.margin,
@@ -190,7 +277,7 @@ class WindowManager:
         )
 
         # 游戏控制区域
-        regions['game_controls'] = (
+        regions['game_controls'] = pygame.Rect(
             0,
             h - l.controls_height,
             w,
@@ -245,31 +332,12 @@ class WindowManager:
         if region_name not in regions:
             return []
 
-        region_x, region_y, region_width, region_height = regions[region_name]
+        region = regions[region_name]
         l = self.layout_config
-
-        # 计算总宽度
-        total_width = card_count * l.card_width + (card_count - 1) * l.spacing
-
-        # 如果总宽度超过区域宽度，调整间距
-        if total_width > region_width and card_count > 1:
-            l.spacing = max(10, (region_width - card_count * l.card_width) // (card_count - 1))
-            total_width = card_count * l.card_width + (card_count - 1) * l.spacing
-
-        # 计算起始X坐标（居中对齐）
-        start_x = region_x + (region_width - total_width) // 2
-
-        # 计算Y坐标（垂直居中）
-        start_y = region_y + (region_height - l.card_height) // 2
-
-        # 生成所有卡牌位置
-        positions = []
-        for i in range(card_count):
-            x = start_x + i * (l.card_width + l.spacing)
-            y = start_y
-            positions.append((x, y))
-
-        return positions
+        return list(_calc_positions(
+            card_count, region.x, region.y, region.w, region.h,
+            l.card_width, l.card_height, l.spacing
+        ))
 
     def is_valid_window_size(self, width: int, height: int) -> bool:
         """
@@ -286,9 +354,17 @@ class WindowManager:
         min_width = 800
         min_height = 600
 
-        # 计算最小所需高度
+        return width >= min_width and height >= max(min_height, self._min_required_height)
+
+    def _compute_min_required_height(self) -> int:
+        """
+        计算布局所需的最小窗口高度
+
+        Returns:
+            int: 各区域高度与间距之和
+        """
         l = self.layout_config
-        min_required_height = (
+        return (
             l.hud_height +
             l.opponent_info_height +
             l.battlefield_height +
@@ -298,8 +374,6 @@ class WindowManager:
             8 * l.spacing  # 间距总和
         )
 
-        return width >= min_width and height >= max(min_height, min_required_height)
-
     def get_optimal_window_size(self, target_width: Optional[int] = None,
                                target_height: Optional[int] = None) -> Tuple[int, int]:
         """
@@ -318,20 +392,8 @@ class WindowManager:
 
         # 确保满足最小尺寸要求
         if not self.is_valid_window_size(width, height):
-            # 计算最小所需高度
-            l = self.layout_config
-            min_height = (
-                l.hud_height +
-                l.opponent_info_height +
-                l.battlefield_height +
-                l.player_info_height +
-                l.hand_area_height +
-                l.controls_height +
-                8 * l.spacing
-            )
-
             width = max(800, width)
-            height = max(600, min_height)
+            height = max(600, self._min_required_height)
 
         return (width, height)
 
@@ -27,16 +27,16 @@ def debug_combat():
     game.opponent.battlefield.append(defender)
 
     print(f"攻击前: attacker.health={attacker.health}, defender.health={defender.health}")
-    print(f"attacker在战场: {attacker in game.current_player.battlefield}")
-    print(f"defender在战场: {defender in game.opponent.battlefield}")
+    print(f"attacker在战场: {game.current_player.contains_minion(attacker)}")
+    print(f"defender在战场: {game.opponent.contains_minion(defender)}")
 
     # 执行攻击
     result = engine.attack_with_minion(attacker, target=defender)
     print(f"攻击结果: {result.success}")
 
     print(f"攻击后: attacker.health={attacker.health}, defender.health={defender.health}")
-    print(f"attacker在战场: {attacker in game.current_player.battlefield}")
-    print(f"defender在战场: {defender in game.opponent.battlefield}")
+    print(f"attacker在战场: {game.current_player.contains_minion(attacker)}")
+    print(f"defender在战场: {game.opponent.contains_minion(defender)}")
     print(f"attacker.can_attack={attacker.can_attack}")
 
 
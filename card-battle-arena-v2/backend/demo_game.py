@@ -4,39 +4,57 @@
 测试游戏引擎是否可以实际游玩
 """
 
+import argparse
+import os
 import sys
 from pathlib import Path
 
-# 添加项目路径
-sys.path.insert(0, str(Path(__file__).parent))
+# 添加项目路径（已在路径中时不重复添加）
+_project_root = str(Path(__file__).parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 
 from app.game.engine import GameEngine
 from app.game.cards import Card, CardType
 
+# 安静模式：跳过每回合的状态输出
+QUIET = os.environ.get("DEMO_QUIET", "") not in ("", "0")
+
 
 def print_game_state(game):
-    """打印游戏状态"""
+    """打印游戏状态（整帧拼接后一次性写出）"""
+    if QUIET:
+        return
+
     current = game.current_player
     opponent = game.opponent
 
-    print(f"\n{'='*60}")
-    print(f"回合 {game.turn_number} - {current.name}的回合")
-    print(f"当前玩家法力值: {current.current_mana}/{current.max_mana}")
-    print(f"对手英雄生命值: {opponent.hero.health}")
-    print(f"当前英雄生命值: {current.hero.health}")
-
-    print(f"\n{current.name}的手牌 ({len(current.hand)}张):")
-    for i, card in enumerate(current.hand):
-        print(f"  {i+1}. {card.name} - 费用:{card.cost} 攻击:{card.attack} 血量:{card.health} 类型:{card.card_type.value}")
-
-    print(f"\n{current.name}的战场 ({len(current.battlefield)}张):")
-    for i, card in enumerate(current.battlefield):
-        attack_status = "可攻击" if card.can_attack else "不可攻击"
-        print(f"  {i+1}. {card.name} - {card.attack}/{card.health} ({attack_status})")
-
-    print(f"\n{opponent.name}的战场 ({len(opponent.battlefield)}张):")
-    for i, card in enumerate(opponent.battlefield):
-        print(f"  {i+1}. {card.name} - {card.attack}/{card.health}")
+    lines = [
+        f"\n{'='*60}",
+        f"回合 {game.turn_number} - {current.name}的回合",
+        f"当前玩家法力值: {current.current_mana}/{current.max_mana}",
+        f"对手英雄生命值: {opponent.hero.health}",
+        f"当前英雄生命值: {current.hero.health}",
+        f"\n{current.name}的手牌 ({len(current.hand)}张):",
+    ]
+    lines.extend(
+        f"  {i+1}. {card.name} - 费用:{card.cost} 攻击:{card.attack} 血量:{card.health} 类型:{card.card_type.value}"
+        for i, card in enumerate(current.hand)
+    )
+
+    lines.append(f"\n{current.name}的战场 ({len(current.battlefield)}张):")
+    lines.extend(
+        f"  {i+1}. {card.name} - {card.attack}/{card.health} ({'可攻击' if card.can_attack else '不可攻击'})"
+        for i, card in enumerate(current.battlefield)
+    )
+
+    lines.append(f"\n{opponent.name}的战场 ({len(opponent.battlefield)}张):")
+    lines.extend(
+        f"  {i+1}. {card.name} - {card.attack}/{card.health}"
+        for i, card in enumerate(opponent.battlefield)
+    )
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demo_game():
@@ -111,6 +129,13 @@ def demo_game():
 
 def main():
     """主函数"""
+    global QUIET
+
+    parser = argparse.ArgumentParser(description="游戏引擎演示")
+    parser.add_argument("--quiet", action="store_true", default=QUIET,
+                        help="安静模式，不输出每回合的游戏状态（也可设置DEMO_QUIET=1）")
+    QUIET = parser.parse_args().quiet
+
     try:
         demo_game()
     except Exception as e:
@@ -4,190 +4,285 @@
 自动化演示完整的对战流程
 """
 
+import argparse
+import os
 import sys
 import time
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
 
-# 添加项目路径
-sys.path.insert(0, str(Path(__file__).parent))
+# 添加项目路径（已在路径中时不重复添加）
+_project_root = str(Path(__file__).parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 
 from app.game.engine import GameEngine
 from app.game.cards import Card, CardType
 
+# 常用卡牌类型，模块级绑定避免逐卡查找枚举属性
+_MINION = CardType.MINION
+_SPELL = CardType.SPELL
+_WEAPON = CardType.WEAPON
 
-def print_game_state(game, show_mana_change=False):
-    """打印游戏状态"""
-    current = game.current_player
-    opponent = game.opponent
+# 演示节奏倍率，0 表示不停顿（便于CI、性能分析和AI自对战）
+PACE = float(os.environ.get("DEMO_PACE", "0"))
 
-    print(f"\n{'='*70}")
-    print(f"🎮 回合 {game.turn_number} - {current.name}的回合")
+# 安静模式：跳过逐回合的状态和动作输出，只保留最终结果
+QUIET = os.environ.get("DEMO_QUIET", "") not in ("", "0")
 
-    # 法力值显示，带有变化提示
-    if show_mana_change:
-        print(f"💰 法力值: {current.current_mana}/{current.max_mana} ✨ (法力值已恢复)")
-    else:
-        print(f"💰 法力值: {current.current_mana}/{current.max_mana}")
 
-    print(f"❤️ {current.name}英雄: {current.hero.health}/30 HP")
-    print(f"🗡️ {opponent.name}英雄: {opponent.hero.health}/30 HP")
+def pace(seconds=1.0):
+    """按节奏倍率停顿，倍率为0时直接返回"""
+    if PACE:
+        time.sleep(seconds * PACE)
+
 
-    print(f"\n🎴 {current.name}的手牌 ({len(current.hand)}张):")
-    for i, card in enumerate(current.hand):
+def say(message):
+    """输出回合内的动作信息，安静模式下不输出"""
+    if not QUIET:
+        print(message)
+
+
+def _format_hand_card(index, card, current_mana):
+    """格式化一张手牌的显示行"""
+    card_type = card.card_type
+    if card_type is _MINION or card_type is _WEAPON:
+        status = f"({card.attack}/{card.health})"  # 武器的health就是durability
+    elif card_type is _SPELL:
+        status = f"(伤害:{card.damage})"
+    else:
         status = ""
-        if card.card_type == CardType.MINION:
-            status = f"({card.attack}/{card.health})"
-        elif card.card_type == CardType.SPELL:
-            status = f"(伤害:{getattr(card, 'damage', 0)})"
-        elif card.card_type == CardType.WEAPON:
-            status = f"({card.attack}/{card.health})"  # 武器的health就是durability
-
-        can_play = "✅" if card.cost <= current.current_mana else "❌"
-        print(f"  {i+1}. {can_play} {card.name} - 费用:{card.cost} {status} [{card.card_type.value}]")
-
-    print(f"\n⚔️ {current.name}的战场 ({len(current.battlefield)}张):")
-    for i, card in enumerate(current.battlefield):
-        attack_status = "🟢可攻击" if card.can_attack else "🔴不可攻击"
-        taunt_status = " [嘲讽]" if card.taunt else ""
-        divine_status = " [圣盾]" if card.divine_shield else ""
-        print(f"  {i+1}. {card.name} - {card.attack}/{card.health} ({attack_status}){taunt_status}{divine_status}")
-
-    print(f"\n🛡️ {opponent.name}的战场 ({len(opponent.battlefield)}张):")
-    for i, card in enumerate(opponent.battlefield):
-        taunt_status = " [嘲讽]" if card.taunt else ""
-        divine_status = " [圣盾]" if card.divine_shield else ""
-        print(f"  {i+1}. {card.name} - {card.attack}/{card.health}{taunt_status}{divine_status}")
+
+    can_play = "✅" if card.cost <= current_mana else "❌"
+    return f"  {index}. {can_play} {card.name} - 费用:{card.cost} {status} [{card_type.value}]"
+
+
+def _minion_tags(card):
+    """随从的嘲讽/圣盾标记"""
+    return (" [嘲讽]" if card.taunt else "") + (" [圣盾]" if card.divine_shield else "")
+
+
+def print_game_state(game, show_mana_change=False):
+    """打印游戏状态（整帧拼接后一次性写出）"""
+    if QUIET:
+        return
+
+    current = game.current_player
+    opponent = game.opponent
+
+    # 法力值显示，带有变化提示
+    mana_hint = " ✨ (法力值已恢复)" if show_mana_change else ""
+
+    lines = [
+        f"\n{'='*70}",
+        f"🎮 回合 {game.turn_number} - {current.name}的回合",
+        f"💰 法力值: {current.current_mana}/{current.max_mana}{mana_hint}",
+        f"❤️ {current.name}英雄: {current.hero.health}/30 HP",
+        f"🗡️ {opponent.name}英雄: {opponent.hero.health}/30 HP",
+        f"\n🎴 {current.name}的手牌 ({len(current.hand)}张):",
+    ]
+    lines.extend(
+        _format_hand_card(i + 1, card, current.current_mana)
+        for i, card in enumerate(current.hand)
+    )
+
+    lines.append(f"\n⚔️ {current.name}的战场 ({len(current.battlefield)}张):")
+    lines.extend(
+        f"  {i+1}. {card.name} - {card.attack}/{card.health} "
+        f"({'🟢可攻击' if card.can_attack else '🔴不可攻击'}){_minion_tags(card)}"
+        for i, card in enumerate(current.battlefield)
+    )
+
+    lines.append(f"\n🛡️ {opponent.name}的战场 ({len(opponent.battlefield)}张):")
+    lines.extend(
+        f"  {i+1}. {card.name} - {card.attack}/{card.health}{_minion_tags(card)}"
+        for i, card in enumerate(opponent.battlefield)
+    )
 
     if current.weapon:
-        print(f"\n🗡️ {current.name}的武器: {current.weapon.name} ({current.weapon.attack}/{current.weapon.durability})")
+        lines.append(f"\n🗡️ {current.name}的武器: {current.weapon.name} ({current.weapon.attack}/{current.weapon.durability})")
 
-    print(f"\n⚡ 英雄技能: {'✅可用' if not current.used_hero_power and current.current_mana >= 2 else '❌不可用'}")
+    hero_power_ready = not current.used_hero_power and current.current_mana >= 2
+    lines.append(f"\n⚡ 英雄技能: {'✅可用' if hero_power_ready else '❌不可用'}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def player_turn(engine, game):
     """玩家回合"""
     current = game.current_player
-    print(f"\n🎯 {current.name}的回合开始！")
-    time.sleep(1)
+    say(f"\n🎯 {current.name}的回合开始！")
+    pace()
 
     # 玩家策略：优先出低费随从
     cards_played = 0
     max_plays = 3  # 最多出3张牌
 
-    # 出牌阶段
-    while cards_played < max_plays and current.current_mana > 0:
-        # 找到可以打出的卡牌
-        playable_cards = [card for card in current.hand if card.cost <= current.current_mana]
+    # 出牌阶段：手牌按费用升序排一次；卡牌效果抽牌使手牌新增时重新排序
+    hand_by_cost = sorted(current.hand, key=lambda x: x.cost)
+    next_index = 0
+    hand_size = len(current.hand)
 
-        if not playable_cards:
-            print(f"💭 {current.name}没有可出的卡牌了")
+    while cards_played < max_plays and current.current_mana > 0:
+        # 选择最低费的卡牌，最低费都打不起时后面的也打不起
+        if next_index >= len(hand_by_cost) or hand_by_cost[next_index].cost > current.current_mana:
+            say(f"💭 {current.name}没有可出的卡牌了")
             break
 
-        # 选择最低费的卡牌
-        playable_cards.sort(key=lambda x: x.cost)
-        card = playable_cards[0]
+        card = hand_by_cost[next_index]
+        next_index += 1
 
-        print(f"🎴 {current.name}选择打出 {card.name} (费用:{card.cost})")
-        time.sleep(1)
+        say(f"🎴 {current.name}选择打出 {card.name} (费用:{card.cost})")
+        pace()
 
         result = engine.play_card(card)
         if result.success:
-            print(f"✅ {current.name}成功打出了 {card.name}！剩余法力: {current.current_mana}/{current.max_mana}")
+            say(f"✅ {current.name}成功打出了 {card.name}！剩余法力: {current.current_mana}/{current.max_mana}")
             cards_played += 1
-            time.sleep(1)
+            pace()
+
+            hand_size -= 1
+            if len(current.hand) != hand_size:
+                hand_by_cost = sorted(current.hand, key=lambda x: x.cost)
+                next_index = 0
+                hand_size = len(current.hand)
         else:
-            print(f"❌ {current.name}打出失败: {result.error}")
+            say(f"❌ {current.name}打出失败: {result.error}")
             break
 
     # 攻击阶段
     attackable_minions = [m for m in current.battlefield if m.can_attack]
     if attackable_minions and game.opponent.battlefield:
-        print(f"\n⚔️ {current.name}考虑攻击...")
-        time.sleep(1)
+        say(f"\n⚔️ {current.name}考虑攻击...")
+        pace()
 
         for attacker in attackable_minions[:2]:  # 最多攻击2次
             # 选择攻击目标（优先攻击低血量随从）
-            targets = sorted(game.opponent.battlefield, key=lambda x: x.health)
-            if targets:
-                target = targets[0]
-                print(f"⚔️ {current.name}的 {attacker.name} 攻击 {target.name}")
-                time.sleep(1)
+            if game.opponent.battlefield:
+                target = min(game.opponent.battlefield, key=attrgetter('health'))
+                say(f"⚔️ {current.name}的 {attacker.name} 攻击 {target.name}")
+                pace()
 
                 result = engine.attack_with_minion(attacker, target)
                 if result.success:
-                    print(f"✅ 攻击成功！")
+                    say(f"✅ 攻击成功！")
                 else:
-                    print(f"❌ 攻击失败: {result.error}")
+                    say(f"❌ 攻击失败: {result.error}")
 
     # 结束回合
-    print(f"\n🔄 {current.name}结束回合")
-    time.sleep(1)
+    say(f"\n🔄 {current.name}结束回合")
+    pace()
     engine.end_turn()
 
 
+def sort_ai_hand(hand):
+    """
+    按AI出牌优先级排序手牌
+
+    Args:
+        hand: 手牌列表
+
+    Returns:
+        (按攻击力降序排列的随从卡, 按费用升序排列的非随从卡)
+    """
+    minion_cards = sorted(
+        (card for card in hand if card.card_type is _MINION),
+        key=lambda x: -x.attack
+    )
+    other_cards = sorted(
+        (card for card in hand if card.card_type is not _MINION),
+        key=lambda x: x.cost
+    )
+    return minion_cards, other_cards
+
+
+def pick_ai_card(minion_cards, other_cards, mana):
+    """AI出牌选择
+
+    优先高攻击力随从，没有打得起的随从时出最低费的其他卡牌。
+    选中的卡牌会从对应列表中移除。
+
+    Args:
+        minion_cards: 按攻击力降序排列的随从卡
+        other_cards: 按费用升序排列的非随从卡
+        mana: 当前可用法力值
+
+    Returns:
+        选中的卡牌，没有可出的卡牌时返回None
+    """
+    for i, card in enumerate(minion_cards):
+        if card.cost <= mana:
+            return minion_cards.pop(i)
+
+    if other_cards and other_cards[0].cost <= mana:
+        return other_cards.pop(0)
+
+    return None
+
+
 def ai_turn(engine, game):
     """AI回合"""
     current = game.current_player
-    print(f"\n🤖 {current.name}的回合开始！")
-    time.sleep(1)
+    say(f"\n🤖 {current.name}的回合开始！")
+    pace()
 
     # AI策略
     cards_played = 0
     max_plays = 3
 
-    # 出牌阶段
-    while cards_played < max_plays and current.current_mana > 0:
-        playable_cards = [card for card in current.hand if card.cost <= current.current_mana]
+    # 出牌阶段：随从按攻击力降序、其余按费用升序各排一次；卡牌效果抽牌使手牌新增时重新排序
+    minion_cards, other_cards = sort_ai_hand(current.hand)
+    hand_size = len(current.hand)
 
-        if not playable_cards:
-            print(f"💭 {current.name}没有可出的卡牌了")
+    while cards_played < max_plays and current.current_mana > 0:
+        card = pick_ai_card(minion_cards, other_cards, current.current_mana)
+        if card is None:
+            say(f"💭 {current.name}没有可出的卡牌了")
             break
 
-        # AI选择策略：优先高攻击力随从
-        if any(card.card_type == CardType.MINION for card in playable_cards):
-            minion_cards = [card for card in playable_cards if card.card_type == CardType.MINION]
-            minion_cards.sort(key=lambda x: x.attack, reverse=True)
-            card = minion_cards[0]
-        else:
-            playable_cards.sort(key=lambda x: x.cost)
-            card = playable_cards[0]
-
-        print(f"🤖 {current.name}选择打出 {card.name} (费用:{card.cost})")
-        time.sleep(1)
+        say(f"🤖 {current.name}选择打出 {card.name} (费用:{card.cost})")
+        pace()
 
         result = engine.play_card(card)
         if result.success:
-            print(f"✅ {current.name}成功打出了 {card.name}！剩余法力: {current.current_mana}/{current.max_mana}")
+            say(f"✅ {current.name}成功打出了 {card.name}！剩余法力: {current.current_mana}/{current.max_mana}")
             cards_played += 1
-            time.sleep(1)
+            pace()
+
+            hand_size -= 1
+            if len(current.hand) != hand_size:
+                minion_cards, other_cards = sort_ai_hand(current.hand)
+                hand_size = len(current.hand)
         else:
-            print(f"❌ {current.name}打出失败: {result.error}")
+            say(f"❌ {current.name}打出失败: {result.error}")
             break
 
     # 攻击阶段
     attackable_minions = [m for m in current.battlefield if m.can_attack]
     if attackable_minions:
-        print(f"\n⚔️ {current.name}考虑攻击...")
-        time.sleep(1)
+        say(f"\n⚔️ {current.name}考虑攻击...")
+        pace()
 
-        for attacker in attackable_minions[:2]:
-            # AI攻击策略：优先攻击敌方英雄
-            targets = [game.opponent.hero] + game.opponent.battlefield
+        opponent_hero = game.opponent.hero
+        opponent_board = game.opponent.battlefield
 
-            for target in targets:
-                print(f"⚔️ {current.name}的 {attacker.name} 攻击 {target.name if hasattr(target, 'name') else '英雄'}")
-                time.sleep(1)
+        for attacker in attackable_minions[:2]:
+            # AI攻击策略：优先攻击敌方英雄，成功一次即停止，不拼接目标列表
+            for target in chain((opponent_hero,), opponent_board):
+                say(f"⚔️ {current.name}的 {attacker.name} 攻击 {target.name if hasattr(target, 'name') else '英雄'}")
+                pace()
 
                 result = engine.attack_with_minion(attacker, target)
                 if result.success:
-                    print(f"✅ 攻击成功！")
+                    say(f"✅ 攻击成功！")
                     break
                 else:
-                    print(f"❌ 攻击失败: {result.error}")
+                    say(f"❌ 攻击失败: {result.error}")
 
     # 结束回合
-    print(f"\n🔄 {current.name}结束回合")
-    time.sleep(1)
+    say(f"\n🔄 {current.name}结束回合")
+    pace()
     engine.end_turn()
 
 
@@ -204,7 +299,7 @@ def demo_game():
     game = engine.create_game("玩家", "AI电脑")
 
     print("✅ 游戏创建成功！")
-    time.sleep(2)
+    pace(2)
 
     turn_count = 0
     max_turns = 10  # 最多进行10个回合
@@ -253,6 +348,17 @@ def demo_game():
 
 def main():
     """主函数"""
+    global PACE, QUIET
+
+    parser = argparse.ArgumentParser(description="玩家 vs AI 自动对战演示")
+    parser.add_argument("--pace", type=float, default=PACE,
+                        help="演示节奏倍率，0为不停顿（默认读取DEMO_PACE环境变量）")
+    parser.add_argument("--quiet", action="store_true", default=QUIET,
+                        help="安静模式，只输出对局结果（也可设置DEMO_QUIET=1）")
+    args = parser.parse_args()
+    PACE = args.pace
+    QUIET = args.quiet
+
     try:
         demo_game()
     except KeyboardInterrupt:
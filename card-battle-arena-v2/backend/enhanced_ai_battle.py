@@ -4,8 +4,10 @@
 包含完整的游戏流程、视觉效果和交互功能
 """
 
+import os
 import sys
-import time
+from collections import OrderedDict
+from enum import Enum
 from pathlib import Path
 
 # 添加项目路径
@@ -24,9 +26,51 @@ from app.visualization.components.card_renderer import CardRenderer
 from app.visualization.components.layout_engine import LayoutEngine
 
 
+def pick_ai_card(hand, mana):
+    """
+    AI出牌选择：单次遍历手牌
+
+    优先攻击力最高的可出随从，没有可出随从时选费用最低的可出卡牌；
+    并列时取手牌中靠前的一张。
+
+    Args:
+        hand: 手牌列表
+        mana: 当前可用法力值
+
+    Returns:
+        选中的卡牌，没有可出的卡牌时返回None
+    """
+    best_minion = None
+    cheapest = None
+    for card in hand:
+        if card.cost > mana:
+            continue
+        if card.card_type is CardType.MINION:
+            if best_minion is None or card.attack > best_minion.attack:
+                best_minion = card
+        elif cheapest is None or card.cost < cheapest.cost:
+            cheapest = card
+
+    return best_minion if best_minion is not None else cheapest
+
+
+class AIPhase(Enum):
+    """AI回合阶段"""
+    THINK = "think"
+    PLAY_PICK = "play_pick"
+    PLAY_EXECUTE = "play_execute"
+    ATTACK_PICK = "attack_pick"
+    ATTACK_EXECUTE = "attack_execute"
+    END = "end"
+    DONE = "done"
+
+
 class EnhancedAIBattle:
     """增强版AI对战类"""
 
+    # 文字surface缓存的最大条目数
+    TEXT_CACHE_SIZE = 512
+
     def __init__(self, width=1200, height=800):
         """初始化增强版AI对战"""
         # 首先初始化pygame
@@ -42,6 +86,10 @@ class EnhancedAIBattle:
         self.layout_engine = LayoutEngine(width, height)
         self.card_renderer = CardRenderer()
 
+        # 玩家信息框颜色：(当前玩家背景, 非当前玩家背景) 和边框色
+        self._info_bg_colors = (self.tokens.COLORS['primary']['light'], self.tokens.COLORS['surface']['ui'])
+        self._border_color = self.tokens.COLORS['ui']['border']
+
         # 游戏状态
         self.engine = None
         self.game = None
@@ -54,58 +102,88 @@ class EnhancedAIBattle:
         self.ai_action_message = ""
         self.ai_message_timer = 0
 
+        # 当前帧的时间（毫秒），由主循环每帧更新
+        self._now = 0
+
+        # AI回合状态机，_ai_phase为None表示不在AI回合中
+        self._ai_phase = None
+        self._ai_next_tick_ms = 0
+        self._ai_cards_played = 0
+        self._ai_pending_card = None
+        self._ai_attackers = []
+        self._ai_attacker = None
+        self._ai_targets = []
+        self._ai_target_index = None
+        self._ai_pending_target = None
+        self._ai_handlers = {
+            AIPhase.THINK: self._ai_think,
+            AIPhase.PLAY_PICK: self._ai_play_pick,
+            AIPhase.PLAY_EXECUTE: self._ai_play_execute,
+            AIPhase.ATTACK_PICK: self._ai_attack_pick,
+            AIPhase.ATTACK_EXECUTE: self._ai_attack_execute,
+            AIPhase.END: self._ai_end,
+            AIPhase.DONE: self._ai_done,
+        }
+
+        # 玩家回合（演示中自动结束）的结束时间
+        self._player_turn_deadline = None
+
         # 动画效果
         self.animations = []
 
+        # 布局缓存：布局只取决于窗口尺寸，窗口尺寸变化时重新计算
+        self._layout = None
+        self._layout_dims = None
+        self._position_cache = {}
+
+        # 局部刷新：上一帧各区域的状态描述，状态未变的区域不提交到显示
+        self._prev_state = {}
+        self._message_rect = None
+        self._full_redraw = True
+        self._background = None
+
+        # 每排卡牌合成后的surface：排名 -> (卡牌与位置状态, surface, 左上角)
+        self._row_cache = {}
+
         # 字体
         self.fonts = {}
+        self._text_cache = OrderedDict()
         self._init_fonts()
 
     def _init_fonts(self):
-        """初始化字体"""
-        try:
-            # 尝试加载中文字体
-            font_names = ["simhei.ttf", "simsun.ttc", "msyh.ttc"]
-
-            # Windows系统字体路径
-            import os
-            if os.name == "nt":
-                font_paths = [
-                    "C:/Windows/Fonts/simhei.ttf",
-                    "C:/Windows/Fonts/simsun.ttc",
-                    "C:/Windows/Fonts/msyh.ttc"
-                ]
-                font_names.extend(font_paths)
-
-            font_loaded = False
-            for font_name in font_names:
-                try:
-                    font = pygame.font.Font(font_name, 24)
-                    if font:
-                        self.fonts['default'] = font
-                        font_loaded = True
-                        break
-                except:
-                    continue
-
-            # 如果无法加载中文字体，使用系统默认字体
-            if not font_loaded:
-                self.fonts['default'] = pygame.font.SysFont("simhei", 24)
-                if not self.fonts['default']:
-                    self.fonts['default'] = pygame.font.Font(None, 24)
+        """初始化字体：所有字号都使用同一个中文字体文件"""
+        self._cjk_path = self._find_cjk_font()
+
+        for name, size in (('default', 24), ('title', 48), ('heading', 32), ('body', 24), ('small', 18)):
+            self.fonts[name] = pygame.font.Font(self._cjk_path, size)
+
+    @staticmethod
+    def _find_cjk_font():
+        """
+        查找可用的中文字体文件
+
+        Returns:
+            字体文件路径，找不到时返回None（使用pygame默认字体）
+        """
+        font_names = ["simhei.ttf", "simsun.ttc", "msyh.ttc"]
+
+        # Windows系统字体路径
+        if os.name == "nt":
+            font_names.extend([
+                "C:/Windows/Fonts/simhei.ttf",
+                "C:/Windows/Fonts/simsun.ttc",
+                "C:/Windows/Fonts/msyh.ttc"
+            ])
+
+        for font_name in font_names:
+            try:
+                pygame.font.Font(font_name, 24)
+                return font_name
+            except (OSError, pygame.error):
+                continue
 
-        except Exception as e:
-            print(f"字体初始化失败: {e}")
-            self.fonts['default'] = pygame.font.Font(None, 24)
-
-        # 创建不同大小的字体
-        base_font = self.fonts['default']
-        self.fonts.update({
-            'title': pygame.font.Font(None, 48),
-            'heading': pygame.font.Font(None, 32),
-            'body': pygame.font.Font(None, 24),
-            'small': pygame.font.Font(None, 18),
-        })
+        # 如果无法直接加载，尝试系统字体
+        return pygame.font.match_font("simhei")
 
     def create_window(self):
         """创建游戏窗口"""
@@ -113,6 +191,7 @@ class EnhancedAIBattle:
             self.screen = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
             pygame.display.set_caption("卡牌对战竞技场 - 增强版AI对战")
             self.clock = pygame.time.Clock()
+            self._build_background()
             return True
         except Exception as e:
             print(f"创建窗口失败: {e}")
@@ -129,125 +208,331 @@ class EnhancedAIBattle:
         print("=" * 50)
 
     def ai_turn_enhanced(self):
-        """增强版AI回合，带视觉效果"""
-        current = self.game.current_player
+        """开始增强版AI回合
 
-        # 显示AI思考状态
+        AI回合由主循环逐帧推进（见 _ai_step），每个动作之间的停顿
+        只是推迟下一步的执行时间，期间主循环照常处理事件和渲染。
+        """
         self.ai_thinking = True
-        self.ai_action_message = "🤔 AI思考中..."
-        self.ai_message_timer = pygame.time.get_ticks() + 1500
-
-        # 渲染思考状态
-        self.render_game_state()
-        pygame.display.flip()
-
-        # 模拟思考时间
-        time.sleep(1.5)
-
-        # AI出牌阶段
-        cards_played = 0
-        max_plays = 3
-
-        while cards_played < max_plays and current.current_mana > 0:
-            playable_cards = [card for card in current.hand if card.cost <= current.current_mana]
+        self._ai_cards_played = 0
+        self._ai_attackers = []
+        self._ai_phase = AIPhase.THINK
+        self._ai_next_tick_ms = self._now
+
+    def _ai_step(self):
+        """推进AI回合状态机，直到遇到需要停顿展示的状态"""
+        delay = 0
+        while delay == 0 and self._ai_phase is not None:
+            delay = self._ai_handlers[self._ai_phase]()
+        self._ai_next_tick_ms = self._now + delay
+
+    def _show_ai_message(self, message, duration_ms):
+        """显示AI操作消息"""
+        self.ai_action_message = message
+        self.ai_message_timer = self._now + duration_ms
+
+    def _ai_think(self):
+        """显示AI思考状态"""
+        self._show_ai_message("🤔 AI思考中...", 1500)
+        self._ai_phase = AIPhase.PLAY_PICK
+        return 1500
+
+    def _ai_play_pick(self):
+        """AI出牌阶段：选择要打出的卡牌"""
+        current = self.game.current_player
 
-            if not playable_cards:
-                self.ai_action_message = "💭 AI没有可出的卡牌了"
-                self.ai_message_timer = pygame.time.get_ticks() + 2000
-                break
+        if self._ai_cards_played >= 3 or current.current_mana <= 0:
+            self._ai_phase = AIPhase.ATTACK_PICK
+            return self._ai_begin_attacks()
+
+        card = pick_ai_card(current.hand, current.current_mana)
+
+        if card is None:
+            self._show_ai_message("💭 AI没有可出的卡牌了", 2000)
+            self._ai_phase = AIPhase.ATTACK_PICK
+            return self._ai_begin_attacks()
+
+        # 显示AI选择
+        self._show_ai_message(f"🎴 AI选择 {card.name} (费用:{card.cost})", 2000)
+        self._ai_pending_card = card
+        self._ai_phase = AIPhase.PLAY_EXECUTE
+        return 1000
+
+    def _ai_play_execute(self):
+        """AI出牌阶段：执行出牌"""
+        card = self._ai_pending_card
+        result = self.engine.play_card(card)
+        if result.success:
+            self._show_ai_message(f"✅ AI成功打出 {card.name}", 1500)
+            self._ai_cards_played += 1
+            self._ai_phase = AIPhase.PLAY_PICK
+            return 1000
+
+        self._show_ai_message(f"❌ AI出牌失败", 2000)
+        self._ai_phase = AIPhase.ATTACK_PICK
+        return self._ai_begin_attacks()
+
+    def _ai_begin_attacks(self):
+        """进入AI攻击阶段，最多用2个随从攻击"""
+        attackable_minions = [m for m in self.game.current_player.battlefield if m.can_attack]
+        if not attackable_minions:
+            self._ai_phase = AIPhase.END
+            return 0
+
+        self._show_ai_message("⚔️ AI考虑攻击...", 2000)
+        self._ai_attackers = attackable_minions[:2]
+
+        # (目标, 显示名) 列表每回合只构建一次，_ai_target_index为None表示需要换下一个攻击者
+        opponent = self.game.opponent
+        self._ai_targets = [(target, getattr(target, 'name', '英雄'))
+                            for target in (opponent.hero, *opponent.battlefield)]
+        self._ai_target_index = None
+        return 1000
+
+    def _ai_attack_pick(self):
+        """AI攻击阶段：选择下一组攻击者和目标"""
+        if self._ai_target_index is None or self._ai_target_index >= len(self._ai_targets):
+            if not self._ai_attackers:
+                self._ai_phase = AIPhase.END
+                return 0
+            self._ai_attacker = self._ai_attackers.pop(0)
+            self._ai_target_index = 0
+
+        target, target_name = self._ai_targets[self._ai_target_index]
+        self._ai_target_index += 1
+        self._show_ai_message(f"⚔️ {self._ai_attacker.name} 攻击 {target_name}", 2000)
+        self._ai_pending_target = target
+        self._ai_phase = AIPhase.ATTACK_EXECUTE
+        return 1000
+
+    def _ai_attack_execute(self):
+        """AI攻击阶段：执行攻击，成功后换下一个攻击者"""
+        result = self.engine.attack_with_minion(self._ai_attacker, self._ai_pending_target)
+        if result.success:
+            self._show_ai_message(f"✅ 攻击成功！", 1000)
+
+            # 剔除本次攻击中死亡的随从
+            opponent = self.game.opponent
+            self._ai_targets = [(t, name) for t, name in self._ai_targets
+                                if t is opponent.hero or opponent.contains_minion(t)]
+            self._ai_target_index = None
+        else:
+            self._show_ai_message(f"❌ 攻击失败", 2000)
 
-            # AI选择策略
-            if any(card.card_type == CardType.MINION for card in playable_cards):
-                minion_cards = [card for card in playable_cards if card.card_type == CardType.MINION]
-                minion_cards.sort(key=lambda x: x.attack, reverse=True)
-                card = minion_cards[0]
-            else:
-                playable_cards.sort(key=lambda x: x.cost)
-                card = playable_cards[0]
+        self._ai_phase = AIPhase.ATTACK_PICK
+        return 0
 
-            # 显示AI选择
-            self.ai_action_message = f"🎴 AI选择 {card.name} (费用:{card.cost})"
-            self.ai_message_timer = pygame.time.get_ticks() + 2000
+    def _ai_end(self):
+        """显示AI结束回合"""
+        self._show_ai_message(f"🔄 {self.game.current_player.name}结束回合", 1500)
+        self._ai_phase = AIPhase.DONE
+        return 1000
 
-            self.render_game_state()
-            pygame.display.flip()
-            time.sleep(1)
-
-            # 执行出牌
-            result = self.engine.play_card(card)
-            if result.success:
-                self.ai_action_message = f"✅ AI成功打出 {card.name}"
-                self.ai_message_timer = pygame.time.get_ticks() + 1500
-                cards_played += 1
-                time.sleep(1)
-            else:
-                self.ai_action_message = f"❌ AI出牌失败"
-                self.ai_message_timer = pygame.time.get_ticks() + 2000
-                break
+    def _ai_done(self):
+        """结束AI回合"""
+        self.engine.end_turn()
+        self.ai_thinking = False
+        self._ai_phase = None
+        return 0
+
+    def _get_layout(self):
+        """获取当前窗口尺寸下的布局，尺寸不变时复用上次计算结果"""
+        dims = (self.width, self.height)
+        if self._layout is None or self._layout_dims != dims:
+            self._layout = self.layout_engine.calculate_layout()
+            self._layout_dims = dims
+            self._position_cache.clear()
+        return self._layout
+
+    def _card_positions(self, card_count, area_rect):
+        """获取区域内的卡牌位置，按卡牌数量和区域缓存"""
+        key = (card_count, area_rect.x, area_rect.y, area_rect.width, area_rect.height)
+        positions = self._position_cache.get(key)
+        if positions is None:
+            positions = self.layout_engine.calculate_card_positions(card_count, area_rect)
+            self._position_cache[key] = positions
+        return positions
+
+    @staticmethod
+    def _cards_state(cards):
+        """卡牌列表的状态描述（影响卡面显示的属性）"""
+        return tuple((id(c), c.attack, c.health, c.taunt, c.divine_shield) for c in cards)
+
+    @staticmethod
+    def _with_label(rect):
+        """区域矩形向上扩展到包含区域标题（标题绘制在区域上方30像素处）"""
+        return pygame.Rect(rect.x, rect.y - 30, rect.w, rect.h + 30)
+
+    def _frame_state(self, regions):
+        """计算本帧各区域的脏矩形和状态描述
+
+        Returns:
+            区域名到 (矩形列表, 状态描述) 的映射
+        """
+        game = self.game
+        current = game.current_player
+        player1, player2 = game.player1, game.player2
+        message_visible = bool(self.ai_action_message) and self._now < self.ai_message_timer
+
+        return {
+            'title': ([regions['title']], (self.turn_count, self.ai_thinking, current.name)),
+            'player_info': ([regions['player_info']],
+                            (player1.hero.health, player1.current_mana, player1.max_mana, current is player1)),
+            'opponent_info': ([regions['opponent_info']],
+                              (player2.hero.health, player2.current_mana, player2.max_mana, current is player2)),
+            'player_battlefield': ([self._with_label(regions['player_battlefield'])],
+                                   self._cards_state(player1.battlefield)),
+            'opponent_battlefield': ([self._with_label(regions['opponent_battlefield'])],
+                                     self._cards_state(player2.battlefield)),
+            'hand': ([self._with_label(regions['hand'])], (current.name, self._cards_state(current.hand))),
+            'message': ([], self.ai_action_message if message_visible else None),
+        }
+
+    def _present(self):
+        """渲染并提交到显示
+
+        只把状态发生变化的区域通过 pygame.display.update 提交，
+        绘制时用裁剪区域限制在这些区域内；全部区域未变化时跳过绘制。
+        首帧和窗口尺寸变化后整屏绘制并flip。
+        """
+        if not self.screen:
+            return
 
-        # AI攻击阶段
-        attackable_minions = [m for m in current.battlefield if m.can_attack]
-        if attackable_minions:
-            self.ai_action_message = "⚔️ AI考虑攻击..."
-            self.ai_message_timer = pygame.time.get_ticks() + 2000
+        regions = self._get_layout()['regions']
+        state = self._frame_state(regions)
+        prev_state = self._prev_state
+        prev_message_rect = self._message_rect
 
+        if self._full_redraw:
             self.render_game_state()
             pygame.display.flip()
-            time.sleep(1)
-
-            for attacker in attackable_minions[:2]:  # 最多攻击2次
-                targets = [self.game.opponent.hero] + self.game.opponent.battlefield
-
-                for target in targets:
-                    target_name = target.name if hasattr(target, 'name') else '英雄'
-                    self.ai_action_message = f"⚔️ {attacker.name} 攻击 {target_name}"
-                    self.ai_message_timer = pygame.time.get_ticks() + 2000
-
-                    self.render_game_state()
-                    pygame.display.flip()
-                    time.sleep(1)
+            self._full_redraw = False
+            self._prev_state = {key: desc for key, (_, desc) in state.items()}
+            return
 
-                    result = self.engine.attack_with_minion(attacker, target)
-                    if result.success:
-                        self.ai_action_message = f"✅ 攻击成功！"
-                        self.ai_message_timer = pygame.time.get_ticks() + 1000
-                        break
-                    else:
-                        self.ai_action_message = f"❌ 攻击失败"
-                        self.ai_message_timer = pygame.time.get_ticks() + 2000
+        changed = [key for key, (_, desc) in state.items() if prev_state.get(key) != desc]
+        if not changed:
+            return
 
-        # 结束AI回合
-        self.ai_action_message = f"🔄 {current.name}结束回合"
-        self.ai_message_timer = pygame.time.get_ticks() + 1500
+        dirty = [rect for key in changed for rect in state[key][0]]
 
-        self.render_game_state()
-        pygame.display.flip()
-        time.sleep(1)
+        # 消息框叠加在其他区域之上，消息变化时其新旧位置都需要提交；
+        # 新消息框的位置要绘制后才知道，因此这时不裁剪
+        if 'message' in changed:
+            self.render_game_state()
+            if prev_message_rect:
+                dirty.append(prev_message_rect)
+            if self._message_rect:
+                dirty.append(self._message_rect)
+        else:
+            self.screen.set_clip(dirty[0].unionall(dirty[1:]))
+            self.render_game_state()
+            self.screen.set_clip(None)
 
-        self.engine.end_turn()
-        self.ai_thinking = False
+        pygame.display.update(dirty)
+        self._prev_state = {key: desc for key, (_, desc) in state.items()}
 
     def render_game_state(self):
         """渲染游戏状态"""
         if not self.screen:
             return
 
-        # 清屏
-        self.screen.fill(self.tokens.COLORS['surface']['board'])
+        # 用预先绘制好的背景清屏
+        self.screen.blit(self._background, (0, 0))
 
         # 计算布局
-        layout = self.layout_engine.calculate_layout()
+        layout = self._get_layout()
         regions = layout['regions']
 
         # 渲染各个区域
         self._render_title(regions['title'])
-        self._render_player_info(regions['player_info'], self.game.player1, "玩家")
-        self._render_player_info(regions['opponent_info'], self.game.player2, "AI电脑")
+        player1, player2 = self.game.player1, self.game.player2
+        player1_active = self.game.current_player is player1
+        active_bg, idle_bg = self._info_bg_colors
+        self._render_player_info(regions['player_info'], player1, "玩家",
+                                 active_bg if player1_active else idle_bg)
+        self._render_player_info(regions['opponent_info'], player2, "AI电脑",
+                                 idle_bg if player1_active else active_bg)
         self._render_battlefield(regions['player_battlefield'], self.game.player1.battlefield, "玩家战场")
         self._render_battlefield(regions['opponent_battlefield'], self.game.player2.battlefield, "AI战场")
         self._render_hand(regions['hand'], self.game.current_player.hand)
         self._render_ai_message()
-        self._render_instructions(regions['instructions'])
+
+        # 操作提示是静态的，已画在背景上，只需从背景恢复这一条区域
+        instructions_rect = regions['instructions']
+        self.screen.blit(self._background, instructions_rect, instructions_rect)
+
+    def _build_background(self):
+        """预先绘制静态背景：棋盘底色和操作提示栏
+
+        窗口创建和尺寸变化时重建；使用与显示相同的像素格式，
+        每帧清屏只需一次不带alpha的blit。
+        """
+        self._background = pygame.Surface(self.screen.get_size()).convert()
+        self._background.fill(self.tokens.COLORS['surface']['board'])
+
+        screen = self.screen
+        self.screen = self._background
+        try:
+            self._render_instructions(self._get_layout()['regions']['instructions'])
+        finally:
+            self.screen = screen
+
+    def _text(self, text, font_key, color):
+        """
+        渲染文字并缓存结果surface
+
+        文字内容大多每回合才变化一次，缓存后每帧只需blit。
+
+        Args:
+            text: 文字内容
+            font_key: self.fonts中的字体名
+            color: 文字颜色
+
+        Returns:
+            文字surface，字体不可用时返回None
+        """
+        key = (text, font_key, color)
+        cache = self._text_cache
+        text_surface = cache.get(key)
+        if text_surface is not None:
+            cache.move_to_end(key)
+            return text_surface
+
+        font = self.fonts.get(font_key)
+        if not font:
+            return None
+
+        # 转为显示格式，之后每帧的blit不再需要逐像素转换
+        text_surface = font.render(text, True, color).convert_alpha()
+
+        cache[key] = text_surface
+        if len(cache) > self.TEXT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return text_surface
+
+    def _text_block(self, lines, font_key, color, line_spacing):
+        """
+        把多行文字合成为一张surface，每行水平居中
+
+        Args:
+            lines: 文字行列表
+            font_key: self.fonts中的字体名
+            color: 文字颜色
+            line_spacing: 相邻两行中心的间距
+
+        Returns:
+            合成后的surface
+        """
+        line_surfaces = [self._text(line, font_key, color) for line in lines]
+        line_height = self.fonts[font_key].get_linesize()
+        width = max(surface.get_width() for surface in line_surfaces)
+        height = (len(lines) - 1) * line_spacing + line_height
+
+        block = pygame.Surface((width, height), pygame.SRCALPHA)
+        for i, surface in enumerate(line_surfaces):
+            block.blit(surface, surface.get_rect(center=(width // 2, i * line_spacing + line_height // 2)))
+        return block.convert_alpha()
 
     def _render_title(self, title_rect):
         """渲染标题"""
@@ -255,43 +540,31 @@ class EnhancedAIBattle:
         pygame.draw.rect(self.screen, self.tokens.COLORS['primary']['main'], title_rect)
 
         # 绘制标题文字
-        font = self.fonts.get('title')
-        if font:
-            current = self.game.current_player
-            ai_status = " [AI思考中]" if self.ai_thinking and current.name == "AI电脑" else ""
-
-            try:
-                title_text = font.render(f"卡牌对战竞技场 - 回合 {self.turn_count}{ai_status}", True, (255, 255, 255))
-            except:
-                title_text = font.render(f"Card Battle Arena - Turn {self.turn_count}{ai_status}", True, (255, 255, 255))
-
+        current = self.game.current_player
+        ai_status = " [AI思考中]" if self.ai_thinking and current.name == "AI电脑" else ""
+        title_text = self._text(f"卡牌对战竞技场 - 回合 {self.turn_count}{ai_status}", 'title', (255, 255, 255))
+        if title_text:
             title_rect_center = title_text.get_rect(center=title_rect.center)
             self.screen.blit(title_text, title_rect_center)
 
-    def _render_player_info(self, info_rect, player, title):
-        """渲染玩家信息"""
+    def _render_player_info(self, info_rect, player, title, bg_color):
+        """渲染玩家信息，bg_color由调用方按是否当前玩家选定"""
         # 绘制信息背景
-        bg_color = self.tokens.COLORS['primary']['light'] if player.name == self.game.current_player.name else self.tokens.COLORS['surface']['ui']
         pygame.draw.rect(self.screen, bg_color, info_rect)
-        pygame.draw.rect(self.screen, self.tokens.COLORS['ui']['border'], info_rect, 2)
+        pygame.draw.rect(self.screen, self._border_color, info_rect, 2)
 
         # 绘制玩家信息
-        font = self.fonts.get('heading')
-        if font:
-            try:
-                name_text = font.render(f"{player.name}", True, self.tokens.COLORS['ui']['text'])
-            except:
-                name_text = font.render("Player", True, self.tokens.COLORS['ui']['text'])
+        name_text = self._text(f"{player.name}", 'heading', self.tokens.COLORS['ui']['text'])
+        if name_text:
             self.screen.blit(name_text, (info_rect.x + 20, info_rect.y + 10))
 
         # 绘制生命值
-        font = self.fonts.get('body')
-        if font:
-            health_text = font.render(f"❤️ 生命值: {player.hero.health}/30", True, (255, 100, 100))
+        health_text = self._text(f"❤️ 生命值: {player.hero.health}/30", 'body', (255, 100, 100))
+        if health_text:
             self.screen.blit(health_text, (info_rect.x + 20, info_rect.y + 60))
 
             # 绘制法力值
-            mana_text = font.render(f"💰 法力值: {player.current_mana}/{player.max_mana}", True, (100, 100, 255))
+            mana_text = self._text(f"💰 法力值: {player.current_mana}/{player.max_mana}", 'body', (100, 100, 255))
             self.screen.blit(mana_text, (info_rect.x + 20, info_rect.y + 90))
 
     def _render_battlefield(self, battlefield_rect, battlefield, title):
@@ -300,20 +573,15 @@ class EnhancedAIBattle:
         pygame.draw.rect(self.screen, self.tokens.COLORS['surface']['ui'], battlefield_rect, 2)
 
         # 绘制标题
-        font = self.fonts.get('body')
-        if font:
-            try:
-                title_text = font.render(f"{title} ({len(battlefield)}张)", True, self.tokens.COLORS['ui']['text'])
-            except:
-                title_text = font.render(f"Battlefield ({len(battlefield)})", True, self.tokens.COLORS['ui']['text'])
+        title_text = self._text(f"{title} ({len(battlefield)}张)", 'body', self.tokens.COLORS['ui']['text'])
+        if title_text:
             self.screen.blit(title_text, (battlefield_rect.x + 20, battlefield_rect.y - 30))
 
         # 计算卡牌位置
-        card_positions = self.layout_engine.calculate_card_positions(len(battlefield), battlefield_rect)
+        card_positions = self._card_positions(len(battlefield), battlefield_rect)
 
         # 渲染卡牌
-        for i, (card, pos) in enumerate(zip(battlefield, card_positions)):
-            self.card_renderer.render_card(card, pos, self.screen)
+        self._blit_card_row(title, battlefield, card_positions)
 
     def _render_hand(self, hand_rect, hand):
         """渲染手牌"""
@@ -321,38 +589,62 @@ class EnhancedAIBattle:
         pygame.draw.rect(self.screen, self.tokens.COLORS['surface']['ui'], hand_rect, 2)
 
         # 绘制标题
-        font = self.fonts.get('body')
-        if font:
-            current_player = self.game.current_player
-            try:
-                title_text = font.render(f"{current_player.name}的手牌 ({len(hand)}张):", True, self.tokens.COLORS['ui']['text'])
-            except:
-                title_text = font.render(f"{current_player.name}'s Hand ({len(hand)}):", True, self.tokens.COLORS['ui']['text'])
+        current_player = self.game.current_player
+        title_text = self._text(f"{current_player.name}的手牌 ({len(hand)}张):", 'body', self.tokens.COLORS['ui']['text'])
+        if title_text:
             self.screen.blit(title_text, (hand_rect.x + 20, hand_rect.y - 30))
 
         # 计算卡牌位置
-        card_positions = self.layout_engine.calculate_card_positions(len(hand), hand_rect)
+        card_positions = self._card_positions(len(hand), hand_rect)
 
-        # 渲染卡牌
-        for i, (card, pos) in enumerate(zip(hand, card_positions)):
-            # 只渲染当前玩家的手牌
-            if card in self.game.current_player.hand:
-                self.card_renderer.render_card(card, pos, self.screen)
+        # 渲染卡牌（只渲染当前玩家的手牌）
+        if hand is not self.game.current_player.hand:
+            return
+        self._blit_card_row('hand', hand, card_positions)
+
+    def _blit_card_row(self, row_key, cards, positions):
+        """
+        把一排卡牌合成为一张surface后整体blit
+
+        卡牌和位置不变时直接复用上次合成的结果，每帧只需一次blit。
+
+        Args:
+            row_key: 这一排的缓存键
+            cards: 卡牌列表
+            positions: 与cards一一对应的位置
+        """
+        positions = positions[:len(cards)]
+        if not positions:
+            return
+
+        row_state = (self._cards_state(cards), tuple(positions))
+        cached = self._row_cache.get(row_key)
+        if cached is None or cached[0] != row_state:
+            card_w, card_h = self.card_renderer.card_width, self.card_renderer.card_height
+            bounds = pygame.Rect(positions[0], (card_w, card_h)).unionall(
+                [pygame.Rect(pos, (card_w, card_h)) for pos in positions[1:]])
+
+            strip = pygame.Surface(bounds.size, pygame.SRCALPHA)
+            for card, (x, y) in zip(cards, positions):
+                self.card_renderer.render_card(card, (x - bounds.x, y - bounds.y), strip)
+            strip = strip.convert_alpha()
+
+            cached = (row_state, strip, bounds.topleft)
+            self._row_cache[row_key] = cached
+
+        self.screen.blit(cached[1], cached[2])
 
     def _render_ai_message(self):
         """渲染AI操作消息"""
-        if self.ai_action_message and pygame.time.get_ticks() < self.ai_message_timer:
-            font = self.fonts.get('heading')
-            if font:
-                try:
-                    message_surface = font.render(self.ai_action_message, True, (255, 200, 0))
-                except:
-                    message_surface = font.render("AI Action...", True, (255, 200, 0))
-
+        self._message_rect = None
+        if self.ai_action_message and self._now < self.ai_message_timer:
+            message_surface = self._text(self.ai_action_message, 'heading', (255, 200, 0))
+            if message_surface:
                 message_rect = message_surface.get_rect(center=(self.width // 2, self.height // 2))
 
                 # 绘制消息背景
                 bg_rect = message_rect.inflate(40, 20)
+                self._message_rect = bg_rect
                 pygame.draw.rect(self.screen, (0, 0, 0), bg_rect)
                 pygame.draw.rect(self.screen, (255, 200, 0), bg_rect, 3)
 
@@ -364,15 +656,9 @@ class EnhancedAIBattle:
         pygame.draw.rect(self.screen, self.tokens.COLORS['ui']['background'], instructions_rect)
 
         # 绘制提示文字
-        font = self.fonts.get('small')
-        if font:
-            try:
-                instructions = "ESC - 退出 | 空格 - 快速结束回合 | 观看AI自动对战演示"
-                instructions_text = font.render(instructions, True, self.tokens.COLORS['ui']['text'])
-            except:
-                instructions = "ESC - Exit | Space - Skip Turn | Watch AI vs AI Demo"
-                instructions_text = font.render(instructions, True, self.tokens.COLORS['ui']['text'])
-
+        instructions_text = self._text("ESC - 退出 | 空格 - 快速结束回合 | 观看AI自动对战演示", 'small',
+                                       self.tokens.COLORS['ui']['text'])
+        if instructions_text:
             instructions_rect_center = instructions_text.get_rect(center=instructions_rect.center)
             self.screen.blit(instructions_text, instructions_rect_center)
 
@@ -386,6 +672,7 @@ class EnhancedAIBattle:
                     return False
                 elif event.key == pygame.K_SPACE:  # 空格键快速结束回合
                     if self.game.current_player.name == "玩家":
+                        self._player_turn_deadline = None
                         self.engine.end_turn()
                         self.engine.start_turn()
                         self.turn_count += 1
@@ -393,7 +680,10 @@ class EnhancedAIBattle:
                 self.width = event.w
                 self.height = event.h
                 self.layout_engine.update_window_size(event.w, event.h)
+                self._layout = None
                 self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+                self._build_background()
+                self._full_redraw = True
 
         return True
 
@@ -408,33 +698,58 @@ class EnhancedAIBattle:
             # 处理事件
             self.running = self.handle_events()
 
-            # AI回合处理
+            # 本帧时间只取一次，AI计时、消息显示和脏区判断使用同一时刻
+            now = self._now = pygame.time.get_ticks()
+
+            # AI回合处理：每帧最多推进一步，停顿期间不阻塞主循环
             if self.game.current_player.name == "AI电脑":
-                self.ai_turn_enhanced()
-                self.engine.start_turn()
-                self.turn_count += 1
+                if self._ai_phase is None:
+                    self.ai_turn_enhanced()
+                elif now >= self._ai_next_tick_ms:
+                    self._ai_step()
+                    if self._ai_phase is None:
+                        self.engine.start_turn()
+                        self.turn_count += 1
             else:
-                # 玩家回合（自动结束，用于演示）
-                time.sleep(1)  # 让玩家看到自己的回合
-                self.engine.end_turn()
-                self.engine.start_turn()
-                self.turn_count += 1
+                # 玩家回合（自动结束，用于演示），停留1秒让玩家看到自己的回合
+                if self._player_turn_deadline is None:
+                    self._player_turn_deadline = now + 1000
+                elif now >= self._player_turn_deadline:
+                    self._player_turn_deadline = None
+                    self.engine.end_turn()
+                    self.engine.start_turn()
+                    self.turn_count += 1
 
             # 检查游戏是否结束
             self.engine.check_win_condition()
 
-            # 渲染游戏状态
-            self.render_game_state()
-
-            # 更新显示
-            pygame.display.flip()
+            # 渲染游戏状态并只提交变化的区域
+            self._present()
             self.clock.tick(30)  # 30 FPS
 
+            # 停顿期间没有需要处理的事情，阻塞等待事件直到下一个计划时间点
+            timeout = self._idle_until() - pygame.time.get_ticks()
+            if timeout > 0:
+                event = pygame.event.wait(timeout)
+                if event.type != pygame.NOEVENT:
+                    pygame.event.post(event)
+
         # 显示游戏结果
         self._show_game_result()
 
         return True
 
+    def _idle_until(self):
+        """下一个需要主循环处理的时间点：AI下一步、玩家回合结束或消息过期"""
+        if self.game.current_player.name == "AI电脑":
+            wake = self._ai_next_tick_ms if self._ai_phase is not None else self._now
+        else:
+            wake = self._player_turn_deadline if self._player_turn_deadline is not None else self._now
+
+        if self._prev_state.get('message') is not None:
+            wake = min(wake, self.ai_message_timer)
+        return wake
+
     def _show_game_result(self):
         """显示游戏结果"""
         if self.game.game_over:
@@ -444,19 +759,13 @@ class EnhancedAIBattle:
             # 在屏幕上显示结果
             self.screen.fill(self.tokens.COLORS['surface']['board'])
 
-            font = self.fonts.get('title')
-            if font:
-                try:
-                    result_text = font.render(f"🏆 {winner_name} 获胜！", True, (255, 215, 0))
-                except:
-                    result_text = font.render(f"Winner: {winner_name}!", True, (255, 215, 0))
-
+            result_text = self._text(f"🏆 {winner_name} 获胜！", 'title', (255, 215, 0))
+            if result_text:
                 result_rect = result_text.get_rect(center=(self.width // 2, self.height // 2 - 50))
                 self.screen.blit(result_text, result_rect)
 
             # 显示统计信息
-            font = self.fonts.get('body')
-            if font:
+            if self.fonts.get('body'):
                 stats = [
                     f"总回合数: {self.turn_count}",
                     f"玩家生命值: {self.game.player1.hero.health}/30",
@@ -465,14 +774,11 @@ class EnhancedAIBattle:
                     f"AI战场: {len(self.game.player2.battlefield)}张随从"
                 ]
 
-                for i, stat in enumerate(stats):
-                    try:
-                        stat_text = font.render(stat, True, (255, 255, 255))
-                    except:
-                        stat_text = font.render(stat, True, (255, 255, 255))
-
-                    stat_rect = stat_text.get_rect(center=(self.width // 2, self.height // 2 + 50 + i * 40))
-                    self.screen.blit(stat_text, stat_rect)
+                stats_block = self._text_block(stats, 'body', (255, 255, 255), 40)
+                first_line_height = self.fonts['body'].get_linesize()
+                stats_rect = stats_block.get_rect(midtop=(self.width // 2,
+                                                          self.height // 2 + 50 - first_line_height // 2))
+                self.screen.blit(stats_block, stats_rect)
 
             pygame.display.flip()
 
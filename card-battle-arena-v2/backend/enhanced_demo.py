@@ -4,9 +4,14 @@
 添加了更多动效和视觉效果，让游戏体验更加生动有趣
 """
 
+import argparse
+import os
+import shutil
 import sys
 import time
 import random
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
@@ -16,24 +21,91 @@ sys.path.insert(0, str(Path(__file__).parent))
 from app.game.engine import GameEngine
 from app.game.cards import Card, CardType
 
+_MINION = CardType.MINION
+_SPELL = CardType.SPELL
+_WEAPON = CardType.WEAPON
+
+
+# 动画开关：关闭后逐字打印和戏剧性暂停都跳过
+ANIMATE = os.environ.get("DEMO_ANIMATE", "1") not in ("", "0")
+
+# 上一次绘制棋盘时的回合标识，同一回合内重绘时不整屏清除
+_last_board = {'key': None}
+
+if os.name == 'nt':
+    # 空命令会让Windows控制台开启VT处理，之后即可直接使用ANSI转义序列
+    os.system('')
+
 
 def clear_screen():
-    """清屏"""
-    import os
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """清屏
+
+    终端下直接写ANSI清屏序列，不再为此启动子进程。
+    """
+    _last_board['key'] = None
+    if sys.stdout.isatty():
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+
+
+def _draw_board(lines, key):
+    """绘制棋盘，同一回合内不整屏清除
+
+    同一回合内从屏幕左上角逐行覆盖整个棋盘并清掉下方残留的菜单文字。
+    棋盘之后输出的菜单可能已让终端滚屏，因此每一行都要重写，不能只改写变化的行。
+
+    Args:
+        lines: 棋盘的逐行文本
+        key: 回合标识，变化时整屏重绘
+    """
+    if not sys.stdout.isatty():
+        sys.stdout.write("\n".join(lines) + "\n")
+        return
+
+    redraw = (
+        _last_board['key'] == key
+        and len(lines) < shutil.get_terminal_size().lines
+    )
+    if not redraw:
+        frame = "\x1b[2J\x1b[H" + "\n".join(lines) + "\n"
+    else:
+        # 每行写完清到行尾，最后清掉棋盘以下的内容，光标停在棋盘下一行
+        frame = "\x1b[H" + "".join(f"{line}\x1b[K\n" for line in lines) + "\x1b[J"
+    # 整帧一次写出并刷新
+    sys.stdout.write(frame)
+    sys.stdout.flush()
+
+    _last_board['key'] = key
 
 
 def animated_print(text, delay=0.03):
-    """带动画效果的打印"""
-    for char in text:
-        print(char, end='', flush=True)
-        time.sleep(delay)
-    print()
+    """带动画效果的打印
+
+    按约60Hz的节奏分块输出，每块只写一次并刷新；delay不大于0时整行一次写出。
+    关闭动画时只写入缓冲区不刷新，由下一次input()或棋盘重绘统一刷出。
+    """
+    write = sys.stdout.write
+    if not ANIMATE:
+        write(text + "\n")
+        return
+    if delay <= 0:
+        write(text + "\n")
+        sys.stdout.flush()
+        return
+
+    chunk = max(1, int(0.016 / delay))
+    for i in range(0, len(text), chunk):
+        piece = text[i:i + chunk]
+        write(piece)
+        sys.stdout.flush()
+        time.sleep(delay * len(piece))
+    write("\n")
 
 
 def dramatic_pause(seconds: float = 1):
     """戏剧性暂停"""
-    time.sleep(seconds)
+    if ANIMATE:
+        time.sleep(seconds)
 
 
 def show_damage_effect(damage, target_name):
@@ -85,121 +157,161 @@ def show_mana_restore_effect(player_name, mana_amount):
     dramatic_pause(0.5)
 
 
-def get_card_skills_display(card):
-    """获取卡牌技能显示文本"""
-    skills = []
-    
+# 静态技能表：(属性名, 显示文本)，属性为真或大于0时显示，数值属性填入{}
+_HEAD_SKILLS = (
+    ('charge', "⚡冲锋"),
+    ('taunt', "🛡️嘲讽"),
+)
+_TAIL_SKILLS = (
     # 基础特殊属性
-    if card.charge:
-        skills.append("⚡冲锋")
-    if card.taunt:
-        skills.append("🛡️嘲讽")
-    if card.divine_shield:
-        skills.append("⭐圣盾")
-    if card.windfury:
-        skills.append("💨风怒")
-    if card.stealth:
-        skills.append("👤潜行")
-    if card.lifelink:
-        skills.append("❤️吸血")
-    if card.poison:
-        skills.append("☠️中毒")
-    if card.reborn:
-        skills.append("🔥复生")
-    if card.echo:
-        skills.append("🎯回响")
-    if card.rush:
-        skills.append("⚔️突袭")
-    
+    ('windfury', "💨风怒"),
+    ('stealth', "👤潜行"),
+    ('lifelink', "❤️吸血"),
+    ('poison', "☠️中毒"),
+    ('reborn', "🔥复生"),
+    ('echo', "🎯回响"),
+    ('rush', "⚔️突袭"),
     # 基础效果
-    if card.battlecry_damage > 0:
-        skills.append(f"💥战吼:造成{card.battlecry_damage}点伤害")
-    if card.deathrattle_draw > 0:
-        skills.append(f"👻亡语:抽{card.deathrattle_draw}张牌")
-    if card.damage > 0:
-        skills.append(f"🔥伤害:{card.damage}点")
-    if card.card_draw > 0:
-        skills.append(f"📖抽牌:{card.card_draw}张")
-    if card.heal_amount > 0:
-        skills.append(f"💚治疗:{card.heal_amount}点")
-    if card.spell_damage > 0:
-        skills.append(f"🔮法术伤害+{card.spell_damage}")
-    if card.mana_gain > 0:
-        skills.append(f"💎获得{card.mana_gain}法力")
-    
+    ('battlecry_damage', "💥战吼:造成{}点伤害"),
+    ('deathrattle_draw', "👻亡语:抽{}张牌"),
+    ('damage', "🔥伤害:{}点"),
+    ('card_draw', "📖抽牌:{}张"),
+    ('heal_amount', "💚治疗:{}点"),
+    ('spell_damage', "🔮法术伤害+{}"),
+    ('mana_gain', "💎获得{}法力"),
     # 进阶效果
-    if card.combo_effect:
-        skills.append("🔗连击")
-    if card.secret_card:
-        skills.append("🔒秘密")
-    if card.quest_progress > 0:
-        skills.append(f"📜任务进度+{card.quest_progress}")
-    if card.aura_effect:
-        skills.append("🌟光环")
-    
+    ('combo_effect', "🔗连击"),
+    ('secret_card', "🔒秘密"),
+    ('quest_progress', "📜任务进度+{}"),
+    ('aura_effect', "🌟光环"),
+)
+
+
+def _collect_skills(card, table):
+    """按技能表收集卡牌上生效的技能文本"""
+    skills = []
+    for attr, label in table:
+        value = getattr(card, attr)
+        if value and value > 0:
+            skills.append(label.format(value))
     return skills
 
 
+def _build_static_skills(card):
+    """构建卡牌创建后不再变化的技能文本
+
+    圣盾会在战斗中被打掉，不在此列，由调用方按当前状态插入。
+
+    Returns:
+        (圣盾之前的技能, 圣盾之后的技能)
+    """
+    return _collect_skills(card, _HEAD_SKILLS), _collect_skills(card, _TAIL_SKILLS)
+
+
+def get_card_skills_display(card):
+    """获取卡牌技能显示文本
+
+    静态技能首次查询时缓存在卡牌的 _skills_cached 属性上，之后只按当前状态补上圣盾。
+    """
+    cached = getattr(card, '_skills_cached', None)
+    if cached is None:
+        cached = _build_static_skills(card)
+        card._skills_cached = cached
+
+    head, tail = cached
+    if card.divine_shield:
+        return head + ["⭐圣盾"] + tail
+    return head + tail
+
+
+def _hand_card_text(card):
+    """手牌一行中除序号和可用标记外的文本
+
+    结果连同生成时的显示属性缓存在卡牌的 _hand_text_cached 属性上，属性未变时直接复用。
+    """
+    key = (card.cost, card.attack, card.health, card.divine_shield)
+    cached = getattr(card, '_hand_text_cached', None)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    card_type = card.card_type
+    if card_type is _MINION or card_type is _WEAPON:
+        status = f"({card.attack}/{card.health})"  # 武器的health就是durability
+    elif card_type is _SPELL:
+        status = f"(伤害:{card.damage})"
+    else:
+        status = ""
+
+    # 显示卡牌技能
+    skills = get_card_skills_display(card)
+    skills_display = ""
+    if skills:
+        if len(skills) <= 2:
+            skills_display = " [" + ", ".join(skills) + "]"
+        else:
+            skills_display = " [" + ", ".join(skills[:2]) + ", ...]"
+
+    text = f"{card.name} - {'🟡' * card.cost} {status} [{card_type.value}]{skills_display}"
+    card._hand_text_cached = (key, text)
+    return text
+
+
+@lru_cache(maxsize=None)
+def _mana_bar(current_mana, max_mana):
+    """法力条文本，取值范围很小，按(当前, 上限)缓存"""
+    return "🔷" * current_mana + "🔹" * (max_mana - current_mana)
+
+
+@lru_cache(maxsize=None)
+def _health_bar(health):
+    """生命条文本，每格3点生命，共10格"""
+    return "🟥" * (health // 3) + "⬜" * (10 - health // 3)
+
+
 def print_game_state(game, show_mana_change=False):
     """打印游戏状态（增强版）"""
     current = game.current_player
     opponent = game.opponent
 
-    # 清屏并显示标题
-    clear_screen()
-    print("🎮" + "="*68 + "🎮")
+    lines = []
+    out = lines.append
+
+    # 标题
+    out("🎮" + "="*68 + "🎮")
     title = f"卡牌对战竞技场 V2 - 回合 {game.turn_number}"
-    print(f"{title:^70}")
-    print("🎮" + "="*68 + "🎮")
+    out(f"{title:^70}")
+    out("🎮" + "="*68 + "🎮")
     
-    print(f"\n{'🔵 ' + current.name + '的回合' if game.current_player_index == 0 else '🔴 ' + current.name + '的回合':^70}")
+    out(f"\n{'🔵 ' + current.name + '的回合' if game.current_player_index == 0 else '🔴 ' + current.name + '的回合':^70}")
 
     # 法力值显示，带有变化提示
-    mana_bar = "🔷" * current.current_mana + "🔹" * (current.max_mana - current.current_mana)
+    mana_bar = _mana_bar(current.current_mana, current.max_mana)
     if show_mana_change:
-        print(f"💰 法力值: {current.current_mana}/{current.max_mana} {mana_bar} ✨ (法力值已恢复)")
+        out(f"💰 法力值: {current.current_mana}/{current.max_mana} {mana_bar} ✨ (法力值已恢复)")
     else:
-        print(f"💰 法力值: {current.current_mana}/{current.max_mana} {mana_bar}")
+        out(f"💰 法力值: {current.current_mana}/{current.max_mana} {mana_bar}")
 
     # 英雄状态
-    print(f"\n{'❤️ 你的英雄:':<30}{'🗡️ 对手英雄:'}")
-    print(f"  {current.hero.health}/30 HP{'':<15}{opponent.hero.health}/30 HP")
+    out(f"\n{'❤️ 你的英雄:':<30}{'🗡️ 对手英雄:'}")
+    out(f"  {current.hero.health}/30 HP{'':<15}{opponent.hero.health}/30 HP")
     
     # 生命值条
-    player_health_bar = "🟥" * (current.hero.health // 3) + "⬜" * (10 - current.hero.health // 3)
-    opponent_health_bar = "🟥" * (opponent.hero.health // 3) + "⬜" * (10 - opponent.hero.health // 3)
-    print(f"  {player_health_bar:<15}{'':<10}{opponent_health_bar}")
+    player_health_bar = _health_bar(current.hero.health)
+    opponent_health_bar = _health_bar(opponent.hero.health)
+    out(f"  {player_health_bar:<15}{'':<10}{opponent_health_bar}")
 
     # 手牌区域
-    print(f"\n🎴 你的手牌 ({len(current.hand)}张):")
+    out(f"\n🎴 你的手牌 ({len(current.hand)}张):")
     if current.hand:
+        mana = current.current_mana
         for i, card in enumerate(current.hand):
-            status = ""
-            if card.card_type == CardType.MINION:
-                status = f"({card.attack}/{card.health})"
-            elif card.card_type == CardType.SPELL:
-                status = f"(伤害:{getattr(card, 'damage', 0)})"
-            elif card.card_type == CardType.WEAPON:
-                status = f"({card.attack}/{card.health})"  # 武器的health就是durability
-
-            can_play = "✅" if card.cost <= current.current_mana else "❌"
-            cost_color = "🟡" * card.cost
-            
-            # 显示卡牌技能
-            skills = get_card_skills_display(card)
-            skills_display = ""
-            if skills:
-                if len(skills) <= 2:
-                    skills_display = " [" + ", ".join(skills) + "]"
-                else:
-                    skills_display = " [" + ", ".join(skills[:2]) + ", ...]"
-            
-            print(f"  {i+1}. {can_play} {card.name} - {cost_color} {status} [{card.card_type.value}]{skills_display}")
+            can_play = "✅" if card.cost <= mana else "❌"
+            out(f"  {i+1}. {can_play} {_hand_card_text(card)}")
     else:
-        print("  (空)")
+        out("  (空)")
 
     # 战场区域
-    print(f"\n⚔️ 你的战场 ({len(current.battlefield)}张):")
+    out(f"\n⚔️ 你的战场 ({len(current.battlefield)}张):")
     if current.battlefield:
         for i, card in enumerate(current.battlefield):
             attack_status = "🟢可攻击" if card.can_attack else "🔴不可攻击"
@@ -215,11 +327,11 @@ def print_game_state(game, show_mana_change=False):
                 else:
                     skills_display = " [" + skills[0] + ", ...]"
             
-            print(f"  {i+1}. {card.name} - {card.attack}/{card.health} ({attack_status}){taunt_status}{divine_status}{skills_display}")
+            out(f"  {i+1}. {card.name} - {card.attack}/{card.health} ({attack_status}){taunt_status}{divine_status}{skills_display}")
     else:
-        print("  (无随从)")
+        out("  (无随从)")
 
-    print(f"\n🛡️ 对手战场 ({len(opponent.battlefield)}张):")
+    out(f"\n🛡️ 对手战场 ({len(opponent.battlefield)}张):")
     if opponent.battlefield:
         for i, card in enumerate(opponent.battlefield):
             taunt_status = " [🛡️嘲讽]" if card.taunt else ""
@@ -234,33 +346,43 @@ def print_game_state(game, show_mana_change=False):
                 else:
                     skills_display = " [" + skills[0] + ", ...]"
             
-            print(f"  {i+1}. {card.name} - {card.attack}/{card.health}{taunt_status}{divine_status}{skills_display}")
+            out(f"  {i+1}. {card.name} - {card.attack}/{card.health}{taunt_status}{divine_status}{skills_display}")
     else:
-        print("  (无随从)")
+        out("  (无随从)")
 
     # 武器装备
     if current.weapon:
-        print(f"\n🗡️ 装备武器: {current.weapon.name} ({current.weapon.attack}/{current.weapon.durability})")
+        out(f"\n🗡️ 装备武器: {current.weapon.name} ({current.weapon.attack}/{current.weapon.durability})")
 
     # 英雄技能
     hero_power_status = "✅可用" if not current.used_hero_power and current.current_mana >= 2 else "❌不可用"
-    print(f"\n⚡ 英雄技能: {hero_power_status} (消耗2法力)")
+    out(f"\n⚡ 英雄技能: {hero_power_status} (消耗2法力)")
+
+    _draw_board("\n".join(lines).split("\n"), (game.turn_number, game.current_player_index))
+
+
+_ACTION_MENU = "\n".join([
+    "\n🎯 请选择行动:",
+    "1. 🃏 打出手牌",
+    "2. ⚡ 使用英雄技能 (消耗2法力)",
+    "3. ⚔️ 随从攻击",
+    "4. 👑 英雄攻击",
+    "5. 🔄 结束回合",
+    "6. 🔍 查看游戏状态",
+    "7. 🚪 退出游戏",
+]) + "\n"
+
+
+_VALID_CHOICES = frozenset("1234567")
 
 
 def get_player_choice():
     """获取玩家选择（增强版）"""
-    print(f"\n🎯 请选择行动:")
-    print(f"1. 🃏 打出手牌")
-    print(f"2. ⚡ 使用英雄技能 (消耗2法力)")
-    print(f"3. ⚔️ 随从攻击")
-    print(f"4. 👑 英雄攻击")
-    print(f"5. 🔄 结束回合")
-    print(f"6. 🔍 查看游戏状态")
-    print(f"7. 🚪 退出游戏")
+    sys.stdout.write(_ACTION_MENU)
 
     while True:
         choice = input("\n请输入选择 (1-7): ").strip()
-        if choice in ['1', '2', '3', '4', '5', '6', '7']:
+        if choice in _VALID_CHOICES:
             return choice
         print("❌ 无效选择，请重新输入")
 
@@ -274,10 +396,9 @@ def play_card_interactive(engine, game):
         dramatic_pause(1)
         return
 
-    print(f"\n🎴 选择要打出的卡牌:")
-    for i, card in enumerate(current.hand):
-        cost_color = "🟡" * card.cost
-        print(f"{i+1}. {card.name} ({cost_color})")
+    menu = ["\n🎴 选择要打出的卡牌:"]
+    menu.extend(f"{i+1}. {card.name} ({'🟡' * card.cost})" for i, card in enumerate(current.hand))
+    print("\n".join(menu))
 
     try:
         choice = int(input("请输入卡牌编号: ")) - 1
@@ -294,7 +415,7 @@ def play_card_interactive(engine, game):
 
         # 检查是否需要目标
         target = None
-        if card.card_type == CardType.SPELL and hasattr(card, 'needs_target') and card.needs_target:
+        if card.card_type is _SPELL and card.needs_target:
             target = choose_target(game)
             if target is None:
                 print("❌ 必须选择一个目标！")
@@ -305,18 +426,20 @@ def play_card_interactive(engine, game):
         if result.success:
             show_card_play_effect(card.name, current.name)
             # 特殊效果显示
-            if hasattr(card, 'damage') and card.damage > 0:
+            if card.damage > 0:
                 if target:
-                    target_name = getattr(target, 'name', '对手英雄')
+                    target_name = target.name
                     show_damage_effect(card.damage, target_name)
-            if hasattr(card, 'heal_amount') and card.heal_amount > 0:
+            if card.heal_amount > 0:
                 show_heal_effect(card.heal_amount, current.name)
-            if hasattr(card, 'card_draw') and card.card_draw > 0:
-                for _ in range(card.card_draw):
-                    if current.deck:
-                        drawn_card = current.deck.pop()
-                        current.hand.append(drawn_card)
-                        show_draw_card_effect(current.name, drawn_card.name)
+            if card.card_draw > 0 and current.deck:
+                # 一次切出要抽的牌，按逐张从牌库顶抽取的顺序加入手牌
+                deck = current.deck
+                count = min(card.card_draw, len(deck))
+                drawn_cards = deck[-count:][::-1]
+                del deck[-count:]
+                current.hand.extend(drawn_cards)
+                show_draw_card_effect(current.name, "、".join(c.name for c in drawn_cards))
         else:
             print(f"❌ 打出失败: {result.error}")
 
@@ -331,16 +454,13 @@ def choose_target(game):
     """选择目标（增强版）"""
     opponent = game.opponent
 
-    print(f"\n🎯 选择目标:")
-    print(f"1. 🎯 {opponent.name}的英雄 ({opponent.hero.health} HP)")
-
-    target_index = 2
+    menu = ["\n🎯 选择目标:", f"1. 🎯 {opponent.name}的英雄 ({opponent.hero.health} HP)"]
     minion_targets = {}
 
-    for i, minion in enumerate(opponent.battlefield):
+    for target_index, minion in enumerate(opponent.battlefield, start=2):
         minion_targets[target_index] = minion
-        print(f"{target_index}. 🛡️ {minion.name} ({minion.attack}/{minion.health})")
-        target_index += 1
+        menu.append(f"{target_index}. 🛡️ {minion.name} ({minion.attack}/{minion.health})")
+    print("\n".join(menu))
 
     try:
         choice = int(input("请输入目标编号: "))
@@ -372,10 +492,11 @@ def use_hero_power_interactive(engine, game):
 
     # 英雄技能动画
     print("⚡ 英雄技能准备中...")
-    for i in range(3):
-        print(".", end="", flush=True)
-        time.sleep(0.5)
-    print()
+    if ANIMATE:
+        for _ in range(3):
+            print(".", end="", flush=True)
+            time.sleep(0.5)
+        print()
 
     result = engine.use_hero_power()
     if result.success:
@@ -397,9 +518,10 @@ def attack_with_minion_interactive(engine, game):
         dramatic_pause(1)
         return
 
-    print(f"\n⚔️ 选择攻击的随从:")
-    for i, minion in enumerate(attackable_minions):
-        print(f"{i+1}. {minion.name} ({minion.attack}/{minion.health})")
+    menu = ["\n⚔️ 选择攻击的随从:"]
+    menu.extend(f"{i+1}. {minion.name} ({minion.attack}/{minion.health})"
+                for i, minion in enumerate(attackable_minions))
+    print("\n".join(menu))
 
     try:
         choice = int(input("请输入随从编号: ")) - 1
@@ -422,15 +544,13 @@ def attack_with_minion_interactive(engine, game):
         
         result = engine.attack_with_minion(attacker, target)
         if result.success:
-            target_name = getattr(target, 'name', '对手英雄')
+            target_name = target.name
             show_attack_effect(attacker.name, target_name, attacker.attack)
             
-            # 检查目标是否死亡
-            if hasattr(target, 'health') and target.health <= 0:
+            # 死亡结果由引擎在结算时给出
+            if result.target_died:
                 show_death_effect(target_name)
-            
-            # 检查攻击者是否死亡
-            if hasattr(attacker, 'health') and attacker.health <= 0:
+            if result.attacker_died:
                 show_death_effect(attacker.name)
                 
             print(f"✅ {attacker.name} 攻击成功！")
@@ -470,11 +590,11 @@ def attack_with_hero_interactive(engine, game):
     
     result = engine.attack_with_hero(target)
     if result.success:
-        target_name = getattr(target, 'name', '对手英雄')
+        target_name = target.name
         show_attack_effect(f"{current.name}(英雄)", target_name, current.weapon.attack)
         
         # 检查目标是否死亡
-        if hasattr(target, 'health') and target.health <= 0:
+        if result.target_died:
             show_death_effect(target_name)
             
         print(f"✅ 英雄攻击成功！")
@@ -493,8 +613,48 @@ def attack_with_hero_interactive(engine, game):
     dramatic_pause(1)
 
 
-def interactive_game():
-    """交互式游戏（增强版）"""
+def end_turn_interactive(engine, game):
+    """结束玩家回合，执行AI回合后开始玩家的新回合"""
+    print(f"🔄 {game.current_player.name} 结束回合")
+    dramatic_pause(1)
+    engine.end_turn()
+
+    # 开始AI对手的回合
+    engine.start_turn()
+
+    # 简单的AI对手回合
+    ai_turn(engine, game)
+
+    # AI结束回合后，开始玩家的新回合
+    engine.start_turn()
+    animated_print("✨ 你的回合开始了！", 0.05)
+    show_mana_restore_effect(game.current_player.name, game.current_player.max_mana)
+    dramatic_pause(1)
+
+
+def show_game_state_interactive(engine, game):
+    """查看游戏状态"""
+    print_game_state(game)
+    dramatic_pause(1)
+
+
+# 菜单选项到处理函数的映射（退出由主循环处理）
+_ACTIONS = {
+    '1': play_card_interactive,        # 打出手牌
+    '2': use_hero_power_interactive,   # 使用英雄技能
+    '3': attack_with_minion_interactive,  # 随从攻击
+    '4': attack_with_hero_interactive,  # 英雄攻击
+    '5': end_turn_interactive,         # 结束回合
+    '6': show_game_state_interactive,  # 查看游戏状态
+}
+
+
+def interactive_game(rng: Optional[random.Random] = None):
+    """交互式游戏（增强版）
+
+    Args:
+        rng: 洗牌用的随机数生成器，传入带种子的实例可复现对局
+    """
     # 开场动画
     clear_screen()
     animated_print("🎮 欢迎来到卡牌对战竞技场 V2!", 0.05)
@@ -502,7 +662,7 @@ def interactive_game():
     dramatic_pause(1)
     
     # 创建游戏引擎
-    engine = GameEngine()
+    engine = GameEngine(rng)
     game = engine.create_game("玩家", "电脑")
 
     animated_print("✅ 游戏创建成功！你是玩家，对手是电脑。", 0.05)
@@ -517,38 +677,14 @@ def interactive_game():
 
         choice = get_player_choice()
 
-        if choice == '1':  # 打出手牌
-            play_card_interactive(engine, game)
-        elif choice == '2':  # 使用英雄技能
-            use_hero_power_interactive(engine, game)
-        elif choice == '3':  # 随从攻击
-            attack_with_minion_interactive(engine, game)
-        elif choice == '4':  # 英雄攻击
-            attack_with_hero_interactive(engine, game)
-        elif choice == '5':  # 结束回合
-            print(f"🔄 {game.current_player.name} 结束回合")
-            dramatic_pause(1)
-            engine.end_turn()
-
-            # 开始AI对手的回合
-            engine.start_turn()
-
-            # 简单的AI对手回合
-            ai_turn(engine, game)
-
-            # AI结束回合后，开始玩家的新回合
-            engine.start_turn()
-            new_turn_starting = True  # 标记新回合开始，显示法力值恢复
-            animated_print("✨ 你的回合开始了！", 0.05)
-            show_mana_restore_effect(game.current_player.name, game.current_player.max_mana)
-            dramatic_pause(1)
-        elif choice == '6':  # 查看游戏状态
-            print_game_state(game)
-            dramatic_pause(1)
-        elif choice == '7':  # 退出游戏
+        if choice == '7':  # 退出游戏
             print("👋 游戏结束！")
             break
 
+        _ACTIONS[choice](engine, game)
+        if choice == '5':
+            new_turn_starting = True  # 标记新回合开始，显示法力值恢复
+
         # 检查胜负
         engine.check_win_condition()
         if game.game_over:
@@ -594,25 +730,29 @@ def ai_turn(engine, game):
     animated_print(f"🤖 AI正在考虑出牌（可用法力: {current.current_mana}）...", 0.05)
     dramatic_pause(1)
 
+    # 按费用排好序后顺序往后走，优先出低费卡；费用相同保持手牌原顺序
+    ordered = sorted(current.hand, key=attrgetter('cost'))
+    index = 0
     while cards_played < max_cards_per_turn:
-        # 每次出牌前重新计算可出的卡牌（因为法力值会变化）
-        playable_cards = [card for card in current.hand if card.cost <= current.current_mana]
-        if not playable_cards:
+        if index >= len(ordered) or ordered[index].cost > current.current_mana:
             break
-
-        # 按费用排序，优先出低费卡
-        playable_cards.sort(key=lambda x: x.cost)
-        card = playable_cards[0]  # 选择最低费的卡
+        card = ordered[index]  # 选择最低费的卡
 
         if can_play_card(card, current, game):
             print(f"🤖 AI选择打出 {card.name} (费用:{card.cost})，剩余法力: {current.current_mana}...")
             dramatic_pause(1)
 
+            hand_size = len(current.hand)
             result = play_card_ai(card, engine, game)
             if result.success:
                 show_card_play_effect(card.name, current.name)
                 print(f"🤖 电脑成功打出了 {card.name}！剩余法力: {current.current_mana}/{current.max_mana}")
                 cards_played += 1
+                index += 1
+                if len(current.hand) != hand_size - 1:
+                    # 抽牌等效果改变了手牌，重新排序
+                    ordered = sorted(current.hand, key=attrgetter('cost'))
+                    index = 0
                 # 短暂延迟显示结果
                 dramatic_pause(1)
             else:
@@ -652,19 +792,20 @@ def should_use_hero_power(player):
 
 def can_play_card(card, player, game):
     """判断AI是否可以打出这张卡"""
-    if card.card_type == CardType.MINION:
+    card_type = card.card_type
+    if card_type is _MINION:
         return True  # 随从卡总是可以打
-    elif card.card_type == CardType.SPELL:
+    elif card_type is _SPELL:
         # 法术卡需要目标
-        return hasattr(card, 'needs_target') and choose_target_ai(card, game) is not None
-    elif card.card_type == CardType.WEAPON:
+        return choose_target_ai(card, game) is not None
+    elif card_type is _WEAPON:
         return player.weapon is None  # 没有武器时才打武器卡
     return False
 
 
 def play_card_ai(card, engine, game):
     """AI打卡逻辑"""
-    if card.card_type == CardType.SPELL and hasattr(card, 'needs_target'):
+    if card.card_type is _SPELL:
         target = choose_target_ai(card, game)
         return engine.play_card(card, target)
     else:
@@ -676,14 +817,13 @@ def choose_target_ai(card, game):
     opponent = game.opponent
 
     # 简单策略：优先攻击对手英雄
-    if hasattr(card, 'damage') and card.damage > 0:
+    if card.damage > 0:
         return opponent.hero
 
     # 如果有随从，优先攻击威胁随从
     if opponent.battlefield:
-        # 选择攻击力最高的随从作为目标
-        threat_minions = sorted(opponent.battlefield, key=lambda x: x.attack, reverse=True)
-        return threat_minions[0]
+        # 选择攻击力最高的随从作为目标（并列时取靠前的）
+        return max(opponent.battlefield, key=attrgetter('attack'))
 
     return opponent.hero
 
@@ -691,15 +831,12 @@ def choose_target_ai(card, game):
 def has_attackers(player):
     """检查是否有可攻击的单位"""
     # 检查随从
-    for minion in player.battlefield:
-        if minion.can_attack:
-            return True
-
-    # 检查英雄武器
-    if player.weapon and player.weapon.durability > 0:
+    if any(minion.can_attack for minion in player.battlefield):
         return True
 
-    return False
+    # 检查英雄武器
+    weapon = player.weapon
+    return bool(weapon and weapon.durability > 0)
 
 
 def perform_attacks_ai(engine, game):
@@ -711,10 +848,12 @@ def perform_attacks_ai(engine, game):
 
     # 随从攻击
     for minion in current.battlefield:
-        if minion.can_attack and attacks_made < 2:  # 限制攻击次数
+        if attacks_made >= 2:  # 限制攻击次数，达到后不必继续扫描
+            break
+        if minion.can_attack:
             target = choose_attack_target_ai(minion, game)
             if target:
-                target_name = getattr(target, 'name', '对手英雄')
+                target_name = target.name
                 print(f"🤖 {minion.name} 准备攻击 {target_name}...")
                 dramatic_pause(1)
 
@@ -730,7 +869,7 @@ def perform_attacks_ai(engine, game):
     if current.weapon and current.weapon.durability > 0 and attacks_made < 2:
         target = choose_attack_target_ai(None, game)  # 英雄攻击
         if target:
-            target_name = getattr(target, 'name', '对手英雄')
+            target_name = target.name
             print(f"🤖 英雄准备使用 {current.weapon.name} 攻击 {target_name}...")
             dramatic_pause(1)
 
@@ -747,10 +886,12 @@ def choose_attack_target_ai(attacker, game):
     opponent = game.opponent
 
     # 如果有嘲讽随从，必须先攻击嘲讽
-    taunt_minions = [m for m in opponent.battlefield if m.taunt]
-    if taunt_minions:
-        # 选择攻击力最低的嘲讽随从
-        return min(taunt_minions, key=lambda x: x.attack)
+    # 选择攻击力最低的嘲讽随从，一次遍历即可
+    taunt_target = min(
+        (m for m in opponent.battlefield if m.taunt), key=attrgetter('attack'), default=None
+    )
+    if taunt_target is not None:
+        return taunt_target
 
     # 英雄攻击策略：优先攻击英雄
     if attacker is None:  # 英雄攻击
@@ -778,8 +919,18 @@ def get_target_name(target):
 
 def main():
     """主函数"""
+    global ANIMATE
+
+    parser = argparse.ArgumentParser(description="增强版交互式游戏演示")
+    parser.add_argument("--no-animate", dest="animate", action="store_false", default=ANIMATE,
+                        help="关闭逐字打印和停顿动画（也可设置DEMO_ANIMATE=0）")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="随机种子，指定后洗牌结果可复现")
+    args = parser.parse_args()
+    ANIMATE = args.animate
+
     try:
-        interactive_game()
+        interactive_game(random.Random(args.seed) if args.seed is not None else None)
     except KeyboardInterrupt:
         print("\n👋 游戏被中断")
     except Exception as e:
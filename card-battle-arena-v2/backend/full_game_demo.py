@@ -4,9 +4,14 @@
 自动化展示游戏引擎的所有功能
 """
 
+import argparse
+import os
+import random
 import sys
 import time
+from operator import attrgetter
 from pathlib import Path
+from typing import Optional
 
 # 添加项目路径
 sys.path.insert(0, str(Path(__file__).parent))
@@ -14,48 +19,69 @@ sys.path.insert(0, str(Path(__file__).parent))
 from app.game.engine import GameEngine
 from app.game.cards import Card, CardType
 
+_MINION = CardType.MINION
+_SPELL = CardType.SPELL
+_WEAPON = CardType.WEAPON
+
+# 动画开关：关闭后回合之间不再停顿
+ANIMATE = os.environ.get("DEMO_ANIMATE", "1") not in ("", "0")
+# 安静模式：跳过每回合的状态输出
+QUIET = os.environ.get("DEMO_QUIET", "") not in ("", "0")
+
 
 def print_game_state(game, title=""):
-    """打印游戏状态"""
+    """打印游戏状态（整帧拼接后一次性写出）"""
+    if QUIET:
+        return
+
+    lines = []
+    out = lines.append
+
     if title:
-        print(f"\n🎯 {title}")
+        out(f"\n🎯 {title}")
 
     current = game.current_player
     opponent = game.opponent
 
-    print(f"\n{'='*70}")
-    print(f"🎮 回合 {game.turn_number} - {current.name}的回合")
-    print(f"💰 法力值: {current.current_mana}/{current.max_mana}")
-    print(f"❤️ 你的英雄: {current.hero.health}/30 HP")
-    print(f"🗡️ 对手英雄: {opponent.hero.health}/30 HP")
+    out(f"\n{'='*70}")
+    out(f"🎮 回合 {game.turn_number} - {current.name}的回合")
+    out(f"💰 法力值: {current.current_mana}/{current.max_mana}")
+    out(f"❤️ 你的英雄: {current.hero.health}/30 HP")
+    out(f"🗡️ 对手英雄: {opponent.hero.health}/30 HP")
 
-    print(f"\n🎴 {current.name}的手牌 ({len(current.hand)}张):")
+    out(f"\n🎴 {current.name}的手牌 ({len(current.hand)}张):")
     for i, card in enumerate(current.hand):
-        status = ""
-        if card.card_type == CardType.MINION:
-            status = f"({card.attack}/{card.health})"
-        elif card.card_type == CardType.SPELL:
-            status = f"(伤害:{getattr(card, 'damage', 0)})"
-        elif card.card_type == CardType.WEAPON:
+        card_type = card.card_type
+        if card_type is _MINION or card_type is _WEAPON:
             status = f"({card.attack}/{card.health})"  # 武器的health就是durability
-        print(f"  {i+1}. {card.name} - 费用:{card.cost} {status} [{card.card_type.value}]")
+        elif card_type is _SPELL:
+            status = f"(伤害:{card.damage})"
+        else:
+            status = ""
+        out(f"  {i+1}. {card.name} - 费用:{card.cost} {status} [{card_type.value}]")
 
-    print(f"\n⚔️ {current.name}的战场 ({len(current.battlefield)}张):")
+    out(f"\n⚔️ {current.name}的战场 ({len(current.battlefield)}张):")
     for i, card in enumerate(current.battlefield):
         attack_status = "🟢可攻击" if card.can_attack else "🔴不可攻击"
         taunt_status = " [嘲讽]" if card.taunt else ""
         divine_status = " [圣盾]" if card.divine_shield else ""
-        print(f"  {i+1}. {card.name} - {card.attack}/{card.health} ({attack_status}){taunt_status}{divine_status}")
+        out(f"  {i+1}. {card.name} - {card.attack}/{card.health} ({attack_status}){taunt_status}{divine_status}")
 
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def simulate_full_game():
-    """模拟一局完整的游戏"""
+
+def simulate_full_game(rng: Optional[random.Random] = None):
+    """模拟一局完整的游戏
+
+    Args:
+        rng: 洗牌用的随机数生成器，传入带种子的实例可复现对局
+    """
     print("🎮 卡牌对战竞技场 V2 - 完整游戏演示")
     print("=" * 70)
     print("🚀 开始一局完整的游戏演示...")
 
     # 创建游戏引擎
-    engine = GameEngine()
+    engine = GameEngine(rng)
     game = engine.create_game("玩家", "电脑")
 
     print_game_state(game, "游戏开始！")
@@ -84,7 +110,8 @@ def simulate_full_game():
 
         # 切换回合
         engine.end_turn()
-        time.sleep(1)  # 短暂暂停让输出更清晰
+        if ANIMATE:
+            time.sleep(1)  # 短暂暂停让输出更清晰
 
     # 显示最终游戏状态
     print_game_state(game, "游戏结束")
@@ -126,7 +153,7 @@ def simulate_player_turn(engine, game):
 
     # 2. 尝试打出手牌
     cards_played = 0
-    for card in current.hand[:]:  # 复制列表避免迭代时修改
+    for card in tuple(current.hand):  # 快照避免迭代时修改
         if cards_played >= 2:  # 最多打2张牌
             break
 
@@ -135,7 +162,7 @@ def simulate_player_turn(engine, game):
 
             # 对于法术牌，需要选择目标
             target = None
-            if card.card_type == CardType.SPELL and hasattr(card, 'needs_target') and card.needs_target:
+            if card.card_type == CardType.SPELL and card.needs_target:
                 # 选择对手英雄作为目标
                 target = game.opponent.hero
 
@@ -146,8 +173,8 @@ def simulate_player_turn(engine, game):
             else:
                 print(f"❌ 打出失败: {result.error}")
 
-    # 3. 尝试随从攻击
-    for minion in current.battlefield[:]:
+    # 3. 尝试随从攻击（攻击英雄不会移除己方随从，直接遍历即可）
+    for minion in current.battlefield:
         if minion.can_attack:
             print(f"\n⚔️ {minion.name} 攻击对手英雄")
             result = engine.attack_with_minion(minion, game.opponent.hero)
@@ -174,15 +201,13 @@ def simulate_ai_turn(engine, game):
                 print(f"🤖 {current.name} 使用了英雄技能！")
 
     # AI策略：优先打出低费随从
-    playable_cards = [c for c in current.hand if c.cost <= current.current_mana]
-    if playable_cards:
-        # 优先打出低费卡
-        playable_cards.sort(key=lambda x: x.cost)
-        card_to_play = playable_cards[0]
-
+    mana = current.current_mana
+    card_to_play = min((c for c in current.hand if c.cost <= mana),
+                       key=attrgetter('cost'), default=None)
+    if card_to_play is not None:
         print(f"\n🤖 {current.name} 打出 {card_to_play.name}")
         target = None
-        if card_to_play.card_type == CardType.SPELL and hasattr(card_to_play, 'needs_target') and card_to_play.needs_target:
+        if card_to_play.card_type == CardType.SPELL and card_to_play.needs_target:
             target = game.opponent.hero
 
         result = engine.play_card(card_to_play, target)
@@ -202,8 +227,21 @@ def simulate_ai_turn(engine, game):
 
 def main():
     """主函数"""
+    global ANIMATE, QUIET
+
+    parser = argparse.ArgumentParser(description="完整游戏自动演示")
+    parser.add_argument("--no-animate", dest="animate", action="store_false", default=ANIMATE,
+                        help="关闭回合间停顿（也可设置DEMO_ANIMATE=0）")
+    parser.add_argument("--quiet", action="store_true", default=QUIET,
+                        help="安静模式，跳过每回合的状态输出（也可设置DEMO_QUIET=1）")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="随机种子，指定后洗牌结果可复现")
+    args = parser.parse_args()
+    ANIMATE = args.animate
+    QUIET = args.quiet
+
     try:
-        simulate_full_game()
+        simulate_full_game(random.Random(args.seed) if args.seed is not None else None)
     except KeyboardInterrupt:
         print("\n👋 游戏被中断")
     except Exception as e:
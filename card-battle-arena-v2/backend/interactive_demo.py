@@ -4,8 +4,12 @@
 让玩家可以实际操作一局游戏
 """
 
+import argparse
+import os
 import sys
 import time
+import traceback
+from operator import attrgetter
 from pathlib import Path
 
 # 添加项目路径
@@ -14,54 +18,72 @@ sys.path.insert(0, str(Path(__file__).parent))
 from app.game.engine import GameEngine
 from app.game.cards import Card, CardType
 
+_MINION = CardType.MINION
+_SPELL = CardType.SPELL
+_WEAPON = CardType.WEAPON
+_by_cost = attrgetter('cost')
+
+# AI每一步之间的停顿秒数，设为0可跳过停顿（用于脚本对局和测试）
+AI_STEP_DELAY = float(os.environ.get("AI_STEP_DELAY", "1.0"))
+
+
+def _pace():
+    """AI动作之间的停顿，方便玩家看清"""
+    if AI_STEP_DELAY:
+        time.sleep(AI_STEP_DELAY)
+
 
 def print_game_state(game, show_mana_change=False):
-    """打印游戏状态"""
+    """打印游戏状态（整帧拼接后一次性写出）"""
     current = game.current_player
     opponent = game.opponent
+    lines = []
+    out = lines.append
 
-    print(f"\n{'='*70}")
-    print(f"🎮 回合 {game.turn_number} - {current.name}的回合")
+    out(f"\n{'='*70}")
+    out(f"🎮 回合 {game.turn_number} - {current.name}的回合")
 
     # 法力值显示，带有变化提示
     if show_mana_change:
-        print(f"💰 法力值: {current.current_mana}/{current.max_mana} ✨ (法力值已恢复)")
+        out(f"💰 法力值: {current.current_mana}/{current.max_mana} ✨ (法力值已恢复)")
     else:
-        print(f"💰 法力值: {current.current_mana}/{current.max_mana}")
+        out(f"💰 法力值: {current.current_mana}/{current.max_mana}")
 
-    print(f"❤️ 你的英雄: {current.hero.health}/30 HP")
-    print(f"🗡️ 对手英雄: {opponent.hero.health}/30 HP")
+    out(f"❤️ 你的英雄: {current.hero.health}/30 HP")
+    out(f"🗡️ 对手英雄: {opponent.hero.health}/30 HP")
 
-    print(f"\n🎴 你的手牌 ({len(current.hand)}张):")
+    out(f"\n🎴 你的手牌 ({len(current.hand)}张):")
     for i, card in enumerate(current.hand):
-        status = ""
-        if card.card_type == CardType.MINION:
-            status = f"({card.attack}/{card.health})"
-        elif card.card_type == CardType.SPELL:
-            status = f"(伤害:{getattr(card, 'damage', 0)})"
-        elif card.card_type == CardType.WEAPON:
+        card_type = card.card_type
+        if card_type is _MINION or card_type is _WEAPON:
             status = f"({card.attack}/{card.health})"  # 武器的health就是durability
+        elif card_type is _SPELL:
+            status = f"(伤害:{card.damage})"
+        else:
+            status = ""
 
         can_play = "✅" if card.cost <= current.current_mana else "❌"
-        print(f"  {i+1}. {can_play} {card.name} - 费用:{card.cost} {status} [{card.card_type.value}]")
+        out(f"  {i+1}. {can_play} {card.name} - 费用:{card.cost} {status} [{card_type.value}]")
 
-    print(f"\n⚔️ 你的战场 ({len(current.battlefield)}张):")
+    out(f"\n⚔️ 你的战场 ({len(current.battlefield)}张):")
     for i, card in enumerate(current.battlefield):
         attack_status = "🟢可攻击" if card.can_attack else "🔴不可攻击"
         taunt_status = " [嘲讽]" if card.taunt else ""
         divine_status = " [圣盾]" if card.divine_shield else ""
-        print(f"  {i+1}. {card.name} - {card.attack}/{card.health} ({attack_status}){taunt_status}{divine_status}")
+        out(f"  {i+1}. {card.name} - {card.attack}/{card.health} ({attack_status}){taunt_status}{divine_status}")
 
-    print(f"\n🛡️ 对手战场 ({len(opponent.battlefield)}张):")
+    out(f"\n🛡️ 对手战场 ({len(opponent.battlefield)}张):")
     for i, card in enumerate(opponent.battlefield):
         taunt_status = " [嘲讽]" if card.taunt else ""
         divine_status = " [圣盾]" if card.divine_shield else ""
-        print(f"  {i+1}. {card.name} - {card.attack}/{card.health}{taunt_status}{divine_status}")
+        out(f"  {i+1}. {card.name} - {card.attack}/{card.health}{taunt_status}{divine_status}")
 
     if current.weapon:
-        print(f"\n🗡️ 装备武器: {current.weapon.name} ({current.weapon.attack}/{current.weapon.durability})")
+        out(f"\n🗡️ 装备武器: {current.weapon.name} ({current.weapon.attack}/{current.weapon.durability})")
+
+    out(f"\n⚡ 英雄技能: {'✅可用' if not current.used_hero_power and current.current_mana >= 2 else '❌不可用'}")
 
-    print(f"\n⚡ 英雄技能: {'✅可用' if not current.used_hero_power and current.current_mana >= 2 else '❌不可用'}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def get_player_choice():
@@ -107,7 +129,7 @@ def play_card_interactive(engine, game):
 
         # 检查是否需要目标
         target = None
-        if card.card_type == CardType.SPELL and hasattr(card, 'needs_target') and card.needs_target:
+        if card.card_type is _SPELL and card.needs_target:
             target = choose_target(game)
             if target is None:
                 print("❌ 必须选择一个目标！")
@@ -275,12 +297,12 @@ def ai_turn(engine, game):
     # 显示AI状态
     print(f"🤖 AI当前法力值: {current.current_mana}/{current.max_mana}")
     print(f"🤖 AI手牌数: {len(current.hand)}")
-    time.sleep(1)  # 短暂延迟让用户看清
+    _pace()  # 短暂延迟让用户看清
 
     # 1. 英雄技能阶段
     if should_use_hero_power(current):
         print(f"🤖 AI正在考虑使用英雄技能...")
-        time.sleep(1)
+        _pace()
         result = engine.use_hero_power()
         if result.success:
             print(f"🤖 电脑使用了英雄技能！")
@@ -292,28 +314,25 @@ def ai_turn(engine, game):
     max_cards_per_turn = 3
 
     print(f"🤖 AI正在考虑出牌（可用法力: {current.current_mana}）...")
-    time.sleep(1)
+    _pace()
 
     while cards_played < max_cards_per_turn:
-        # 每次出牌前重新计算可出的卡牌（因为法力值会变化）
-        playable_cards = [card for card in current.hand if card.cost <= current.current_mana]
-        if not playable_cards:
+        # 每次出牌前按当前法力值一次遍历选出最低费的可出卡牌（费用相同取靠前的）
+        mana = current.current_mana
+        card = min((c for c in current.hand if c.cost <= mana), key=_by_cost, default=None)
+        if card is None:
             break
 
-        # 按费用排序，优先出低费卡
-        playable_cards.sort(key=lambda x: x.cost)
-        card = playable_cards[0]  # 选择最低费的卡
-
         if can_play_card(card, current, game):
             print(f"🤖 AI选择打出 {card.name} (费用:{card.cost})，剩余法力: {current.current_mana}...")
-            time.sleep(1)
+            _pace()
 
             result = play_card_ai(card, engine, game)
             if result.success:
                 print(f"🤖 电脑成功打出了 {card.name}！剩余法力: {current.current_mana}/{current.max_mana}")
                 cards_played += 1
                 # 短暂延迟显示结果
-                time.sleep(1)
+                _pace()
             else:
                 print(f"🤖 打出 {card.name} 失败: {result.error}")
                 break  # 如果失败，停止尝试出牌
@@ -323,12 +342,12 @@ def ai_turn(engine, game):
     # 3. 攻击阶段
     if has_attackers(current):
         print(f"🤖 AI正在考虑攻击...")
-        time.sleep(1)
+        _pace()
         perform_attacks_ai(engine, game)
 
     # 结束回合
     print(f"🤖 电脑结束回合")
-    time.sleep(1)
+    _pace()
     engine.end_turn()
 
 
@@ -351,19 +370,20 @@ def should_use_hero_power(player):
 
 def can_play_card(card, player, game):
     """判断AI是否可以打出这张卡"""
-    if card.card_type == CardType.MINION:
+    card_type = card.card_type
+    if card_type is _MINION:
         return True  # 随从卡总是可以打
-    elif card.card_type == CardType.SPELL:
+    elif card_type is _SPELL:
         # 法术卡需要目标
-        return hasattr(card, 'needs_target') and choose_target_ai(card, game) is not None
-    elif card.card_type == CardType.WEAPON:
+        return choose_target_ai(card, game) is not None
+    elif card_type is _WEAPON:
         return player.weapon is None  # 没有武器时才打武器卡
     return False
 
 
 def play_card_ai(card, engine, game):
     """AI打卡逻辑"""
-    if card.card_type == CardType.SPELL and hasattr(card, 'needs_target'):
+    if card.card_type is _SPELL:
         target = choose_target_ai(card, game)
         return engine.play_card(card, target)
     else:
@@ -375,14 +395,13 @@ def choose_target_ai(card, game):
     opponent = game.opponent
 
     # 简单策略：优先攻击对手英雄
-    if hasattr(card, 'damage') and card.damage > 0:
+    if card.damage > 0:
         return opponent.hero
 
     # 如果有随从，优先攻击威胁随从
     if opponent.battlefield:
-        # 选择攻击力最高的随从作为目标
-        threat_minions = sorted(opponent.battlefield, key=lambda x: x.attack, reverse=True)
-        return threat_minions[0]
+        # 选择攻击力最高的随从作为目标（并列时取靠前的）
+        return max(opponent.battlefield, key=attrgetter('attack'))
 
     return opponent.hero
 
@@ -407,28 +426,32 @@ def perform_attacks_ai(engine, game):
     opponent = game.opponent
 
     attacks_made = 0
+    # 嘲讽随从只会因阵亡而变化，整个攻击阶段共用一份，有目标阵亡时再重算
+    taunts = _taunt_minions(opponent)
 
     # 随从攻击
     for minion in current.battlefield:
         if minion.can_attack and attacks_made < 2:  # 限制攻击次数
-            target = choose_attack_target_ai(minion, game)
+            target = choose_attack_target_ai(minion, game, taunts)
             if target:
                 print(f"🤖 {minion.name} 准备攻击 {get_target_name(target)}...")
-                time.sleep(1)
+                _pace()
 
                 result = engine.attack_with_minion(minion, target)
                 if result.success:
                     print(f"🤖 {minion.name} 攻击了 {get_target_name(target)}！")
                     attacks_made += 1
+                    if result.target_died:
+                        taunts = _taunt_minions(opponent)
                 else:
                     print(f"🤖 {minion.name} 攻击失败: {result.error}")
 
     # 英雄攻击（如果有武器）
     if current.weapon and current.weapon.durability > 0 and attacks_made < 2:
-        target = choose_attack_target_ai(None, game)  # 英雄攻击
+        target = choose_attack_target_ai(None, game, taunts)  # 英雄攻击
         if target:
             print(f"🤖 英雄准备使用 {current.weapon.name} 攻击 {get_target_name(target)}...")
-            time.sleep(1)
+            _pace()
 
             result = engine.attack_with_hero(target)
             if result.success:
@@ -437,12 +460,24 @@ def perform_attacks_ai(engine, game):
                 print(f"🤖 英雄攻击失败: {result.error}")
 
 
-def choose_attack_target_ai(attacker, game):
-    """AI选择攻击目标"""
+def _taunt_minions(player):
+    """玩家战场上的嘲讽随从"""
+    return [m for m in player.battlefield if m.taunt]
+
+
+def choose_attack_target_ai(attacker, game, taunt_minions=None):
+    """AI选择攻击目标
+
+    Args:
+        attacker: 攻击的随从，英雄攻击时为None
+        game: 当前游戏
+        taunt_minions: 预先算好的对手嘲讽随从列表，不传时现场计算
+    """
     opponent = game.opponent
 
     # 如果有嘲讽随从，必须先攻击嘲讽
-    taunt_minions = [m for m in opponent.battlefield if m.taunt]
+    if taunt_minions is None:
+        taunt_minions = _taunt_minions(opponent)
     if taunt_minions:
         # 选择攻击力最低的嘲讽随从
         return min(taunt_minions, key=lambda x: x.attack)
@@ -473,13 +508,21 @@ def get_target_name(target):
 
 def main():
     """主函数"""
+    global AI_STEP_DELAY
+
+    parser = argparse.ArgumentParser(description="交互式游戏演示")
+    parser.add_argument("--fast", action="store_true",
+                        help="跳过AI动作之间的停顿（也可设置AI_STEP_DELAY=0）")
+    args = parser.parse_args()
+    if args.fast:
+        AI_STEP_DELAY = 0.0
+
     try:
         interactive_game()
     except KeyboardInterrupt:
         print("\n👋 游戏被中断")
     except Exception as e:
         print(f"❌ 游戏出错: {e}")
-        import traceback
         traceback.print_exc()
 
 
@@ -5,8 +5,10 @@
 真正的可玩卡牌游戏，支持鼠标点击和拖拽操作。
 """
 
+import os
 import sys
 import time
+import traceback
 from pathlib import Path
 
 # 添加项目路径
@@ -16,25 +18,29 @@ from app.visualization.improved_interactive_renderer import ImprovedInteractiveR
 from app.visualization.window_manager import WindowConfig
 
 
+_BANNER = "\n".join([
+    "╔══════════════════════════════════════════════════════════════╗",
+    "║                🎮 卡牌对战竞技场 V2 🎮                       ║",
+    "║                    交互式游戏模式                            ║",
+    "╠══════════════════════════════════════════════════════════════╣",
+    "║ 操作说明:                                                   ║",
+    "║ • 鼠标左键点击: 选择/取消选择卡牌                           ║",
+    "║ • 鼠标拖拽: 将手牌拖拽到战场出牌                           ║",
+    "║ • 空格键: 结束回合                                         ║",
+    "║ • ESC键: 取消选择                                         ║",
+    "║ • M键: 显示游戏菜单                                       ║",
+    "║ • 数字键1-7: 快速执行对应操作                              ║",
+    "║ • 关闭窗口: 退出游戏                                       ║",
+    "╚══════════════════════════════════════════════════════════════╝",
+    "",
+]) + "\n"
+
+
 def main():
     """主函数"""
-    print("╔══════════════════════════════════════════════════════════════╗")
-    print("║                🎮 卡牌对战竞技场 V2 🎮                       ║")
-    print("║                    交互式游戏模式                            ║")
-    print("╠══════════════════════════════════════════════════════════════╣")
-    print("║ 操作说明:                                                   ║")
-    print("║ • 鼠标左键点击: 选择/取消选择卡牌                           ║")
-    print("║ • 鼠标拖拽: 将手牌拖拽到战场出牌                           ║")
-    print("║ • 空格键: 结束回合                                         ║")
-    print("║ • ESC键: 取消选择                                         ║")
-    print("║ • M键: 显示游戏菜单                                       ║")
-    print("║ • 数字键1-7: 快速执行对应操作                              ║")
-    print("║ • 关闭窗口: 退出游戏                                       ║")
-    print("╚══════════════════════════════════════════════════════════════╝")
-    print()
+    sys.stdout.write(_BANNER)
 
     # 从环境变量获取窗口设置
-    import os
     width = int(os.environ.get('WINDOW_WIDTH', 1200))
     height = int(os.environ.get('WINDOW_HEIGHT', 800))
     fullscreen = os.environ.get('FULLSCREEN', 'false').lower() == 'true'
@@ -70,7 +76,6 @@ def main():
         return 130
     except Exception as e:
         print(f"\n❌ 游戏运行时发生错误: {e}")
-        import traceback
         traceback.print_exc()
         return 1
 
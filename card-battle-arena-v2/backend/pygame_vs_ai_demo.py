@@ -4,9 +4,12 @@
 支持完整的玩家vs AI对战，包含AI操作动画和视觉反馈
 """
 
+import heapq
 import sys
 import time
 import pygame
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 
 # 添加项目路径
@@ -16,16 +19,132 @@ from app.game.engine import GameEngine
 from app.game.cards import Card, CardType
 from app.visualization.pygame_renderer import PygameRenderer
 
+_MINION = CardType.MINION
+
+
+# 每帧最多处理的事件数，超出的留在队列里下一帧处理
+EVENT_BATCH = 32
+
+
+class _QuitRequested(Exception):
+    """AI动画等待期间用户关闭窗口或按下ESC"""
+
+
+def _drain_events(max_events=EVENT_BATCH):
+    """
+    泵一次事件队列并批量取出事件
+
+    Args:
+        max_events: 本次最多返回的事件数
+
+    Returns:
+        事件列表，超出上限的事件按原顺序放回队列
+    """
+    pygame.event.pump()
+    events = pygame.event.get(pump=False)
+    if len(events) > max_events:
+        for event in events[max_events:]:
+            pygame.event.post(event)
+        events = events[:max_events]
+    return events
+
+
+def _is_quit(event):
+    """是否为退出事件（关闭窗口或ESC）"""
+    return event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE)
+
+
+@lru_cache(maxsize=256)
+def _ai_action_msg(action, card_name, success):
+    """AI操作结果消息；同一结果重复出现时复用同一个字符串，文字surface缓存也能直接命中"""
+    if success:
+        return f"✅ AI {action}: {card_name}"
+    return f"❌ AI {action} 失败: {card_name}"
+
 
 class EnhancedPygameRenderer(PygameRenderer):
     """增强版Pygame渲染器，支持AI对战"""
 
+    TEXT_CACHE_SIZE = 512
+
+    # 操作提示栏文字，只在绘制底图时渲染一次
+    INSTRUCTIONS_TEXT = "鼠标: 左键选择/出牌, 右键取消 | 键盘: ←→选择, 空格选中, 回车出牌 | 按键: N-结束回合, ESC-退出"
+    INSTRUCTIONS_FALLBACK = "Mouse: Left-Select/Play, Right-Cancel | Keys: ←→Select, Space-Select, Enter-Play | Keys: N-End Turn, ESC-Exit"
+
     def __init__(self, width=1200, height=800):
         super().__init__(width, height)
         self.ai_thinking = False
         self.ai_action_message = ""
-        self.ai_message_timer = 0
-        self.highlighted_cards = []
+        # AI消息剩余显示时间（毫秒），由update_display按帧间隔递减
+        self.ai_message_remaining_ms = 0
+        # 高亮卡牌按对象身份记录：id(card)
+        self.highlighted_cards = set()
+        # 文字surface的LRU缓存：(字体, 文字, 颜色) -> surface
+        self._text_cache = OrderedDict()
+        # 局部重绘：不变的底图、上一帧各区域的状态和消息框位置
+        self._background = None
+        self._instructions_rect = None
+        self._layout_key = None
+        self._prev_state = {}
+        # 玩家信息和法力条区域：缓存的surface及其对应的数值状态
+        self._hud_surface = None
+        self._last_hud_state = None
+        self._message_rect = None
+
+    def _text(self, font, text, color, fallback=None):
+        """
+        渲染文字并缓存结果surface
+
+        标题、名字、提示等文字大多每回合才变化一次，缓存后每帧只需blit。
+
+        Args:
+            font: 使用的字体
+            text: 文字内容
+            color: 文字颜色
+            fallback: 文字渲染失败时改用的内容
+
+        Returns:
+            文字surface
+        """
+        key = (font, text, color)
+        cache = self._text_cache
+        text_surface = cache.get(key)
+        if text_surface is not None:
+            cache.move_to_end(key)
+            return text_surface
+
+        try:
+            text_surface = font.render(text, True, color)
+        except Exception:
+            if fallback is None:
+                raise
+            text_surface = font.render(fallback, True, color)
+        if pygame.display.get_surface() is not None:
+            # 转为显示格式，之后每帧的blit不再需要逐像素转换
+            text_surface = text_surface.convert_alpha()
+
+        cache[key] = text_surface
+        if len(cache) > self.TEXT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return text_surface
+
+    def _wait_animated(self, ms, game):
+        """
+        代替time.sleep的等待：按60帧持续重绘并处理事件，等待期间窗口不会卡住
+
+        Args:
+            ms: 等待的毫秒数
+            game: 需要持续渲染的游戏状态
+
+        Raises:
+            _QuitRequested: 等待期间收到退出事件
+        """
+        end = pygame.time.get_ticks() + ms
+        while pygame.time.get_ticks() < end:
+            if any(_is_quit(event) for event in _drain_events()):
+                raise _QuitRequested()
+            self.render_game_state(game)
+            self.update_display()
 
     def render_ai_thinking(self, is_thinking: bool = False):
         """渲染AI思考状态"""
@@ -34,111 +153,264 @@ class EnhancedPygameRenderer(PygameRenderer):
     def set_ai_action_message(self, message: str):
         """设置AI操作消息"""
         self.ai_action_message = message
-        self.ai_message_timer = pygame.time.get_ticks() + 2000  # 显示2秒
+        self.ai_message_remaining_ms = 2000  # 显示2秒
+
+    def update_display(self):
+        """
+        控制帧率，并按距上一帧的时间递减AI消息的剩余显示时间
+
+        Returns:
+            距上一帧的毫秒数
+        """
+        if not self.clock:
+            return 0
+        dt = self.clock.tick(60)
+        if self.ai_message_remaining_ms:
+            self.ai_message_remaining_ms = max(0, self.ai_message_remaining_ms - dt)
+        return dt
 
     def highlight_card(self, card, highlight: bool = True):
         """高亮显示卡牌"""
-        if highlight and card not in self.highlighted_cards:
-            self.highlighted_cards.append(card)
-        elif not highlight and card in self.highlighted_cards:
-            self.highlighted_cards.remove(card)
+        if highlight:
+            self.highlighted_cards.add(id(card))
+        else:
+            self.highlighted_cards.discard(id(card))
 
-    def render_game_state(self, game):
-        """重写游戏状态渲染，添加AI支持"""
-        if not self.screen:
-            return
+    def _title_text(self, game):
+        """标题文字：当前回合和AI状态"""
+        current = game.current_player
+        if current.name == "AI电脑":
+            title_text = f"🤖 {current.name}的回合 - 回合 {game.turn_number}"
+            if self.ai_thinking:
+                title_text += " [思考中]"
+            return title_text
+        return f"👤 {current.name}的回合 - 回合 {game.turn_number}"
 
-        # 清屏
-        self.screen.fill(self.LIGHT_GRAY)
+    def _build_background(self):
+        """预先绘制每帧都不变的底图：底色、标题栏、玩家信息面板和操作提示栏"""
+        background = pygame.Surface((self.width, self.height)).convert()
+        background.fill(self.LIGHT_GRAY)
 
-        # 绘制标题背景
-        title_bg = pygame.Rect(0, 0, self.width, 70)
-        pygame.draw.rect(self.screen, self.DARK_GREEN, title_bg)
+        # 标题背景
+        pygame.draw.rect(background, self.DARK_GREEN, pygame.Rect(0, 0, self.width, 70))
 
-        # 绘制标题
-        if self.large_font and self.screen:
-            current = game.current_player
-            opponent = game.opponent
-
-            # 显示当前回合和AI状态
-            if current.name == "AI电脑":
-                title_text = f"🤖 {current.name}的回合 - 回合 {game.turn_number}"
-                if self.ai_thinking:
-                    title_text += " [思考中]"
-            else:
-                title_text = f"👤 {current.name}的回合 - 回合 {game.turn_number}"
+        # 玩家信息区域
+        pygame.draw.rect(background, self.LIGHT_BLUE, (0, 70, self.width // 2, 120))
+        pygame.draw.rect(background, self.LIGHT_BLUE, (self.width // 2, 70, self.width // 2, 120))
 
-            try:
-                title_surface = self.large_font.render(title_text, True, self.WHITE)
-                title_rect = title_surface.get_rect(center=(self.width // 2, 35))
-                self.screen.blit(title_surface, title_rect)
-            except:
-                title_text = f"Turn {game.turn_number} - {current.name}"
-                title_surface = self.large_font.render(title_text, True, self.WHITE)
-                title_rect = title_surface.get_rect(center=(self.width // 2, 35))
-                self.screen.blit(title_surface, title_rect)
-
-        # 绘制玩家信息区域
-        pygame.draw.rect(self.screen, self.LIGHT_BLUE, (0, 70, self.width // 2, 120))
-        pygame.draw.rect(self.screen, self.LIGHT_BLUE, (self.width // 2, 70, self.width // 2, 120))
-
-        # 绘制玩家信息
+        # 操作提示区域
+        instructions_bg = pygame.Rect(0, self.height - 60, self.width, 60)
+        pygame.draw.rect(background, self.DARK_GRAY, instructions_bg)
+
+        # 操作提示
+        if self.small_font:
+            instructions_text = self._text(self.small_font, self.INSTRUCTIONS_TEXT, self.WHITE,
+                                           fallback=self.INSTRUCTIONS_FALLBACK)
+            instructions_rect = instructions_text.get_rect(center=(self.width // 2, self.height - 30))
+            background.blit(instructions_text, instructions_rect)
+
+        self._background = background
+        self._last_hud_state = None
+        self._instructions_rect = instructions_bg
+
+    def _message_box(self, message):
+        """
+        计算AI消息的文字surface、文字位置和背景框
+
+        Returns:
+            (文字surface, 文字矩形, 背景矩形)，无法渲染时返回None
+        """
+        if not message or not self.small_font:
+            return None
+        try:
+            message_surface = self._text(self.small_font, message, self.ORANGE)
+        except Exception:
+            return None
+        message_rect = message_surface.get_rect(center=(self.width // 2, self.height // 2))
+        return message_surface, message_rect, message_rect.inflate(20, 10)
+
+    @staticmethod
+    def _cards_state(cards):
+        """卡牌列表中影响绘制的属性"""
+        return tuple(
+            (card.id, card.name, card.cost, card.attack, card.health,
+             card.taunt, card.divine_shield, card.windfury, card.charge)
+            for card in cards
+        )
+
+    def _frame_state(self, game, message):
+        """
+        计算本帧各区域的脏矩形和状态描述
+
+        战场区域的卡牌会超出边框，矩形按卡牌实际范围取高。
+
+        Returns:
+            区域名到 (矩形, 状态描述) 的映射
+        """
         current = game.current_player
         opponent = game.opponent
+        width = self.width
+        hand = current.hand[:self.max_cards_per_row]
+        box = self._message_box(message)
+
+        return {
+            'title': (pygame.Rect(0, 0, width, 70), self._title_text(game)),
+            'status': (self._hud_rect(), self._hud_state(current, opponent)),
+            'hand': (pygame.Rect(0, self.hand_area_y - 50, width, 220),
+                     (self._cards_state(hand),
+                      tuple(id(card) in self.highlighted_cards for card in hand),
+                      bool(self.selected_card), self.selected_card_index, self.keyboard_selected_index)),
+            'player_battlefield': (pygame.Rect(0, self.player_battlefield_y - 50, width, 210),
+                                   self._cards_state(current.battlefield[:self.max_cards_per_row])),
+            'opponent_battlefield': (pygame.Rect(0, self.opponent_battlefield_y - 50, width, 210),
+                                     self._cards_state(opponent.battlefield[:self.max_cards_per_row])),
+            'message': (box[2] if box else None, message if box else None),
+        }
+
+    def _hud_rect(self):
+        """玩家信息和法力条所在的区域"""
+        return pygame.Rect(0, 70, self.width, self.mana_bar_y + 25 - 70)
+
+    @staticmethod
+    def _hud_state(current, opponent):
+        """玩家信息区域显示内容所依赖的数值"""
+        return (current.name, current.hero.health, opponent.name, opponent.hero.health,
+                current.current_mana, current.max_mana)
+
+    def _get_hud_surface(self, current, opponent, hud_rect):
+        """
+        获取玩家信息和法力条的surface，数值不变时直接复用上次绘制的结果
+
+        surface从底图对应区域复制而来，不透明，可以直接覆盖到屏幕上。
+
+        Args:
+            current: 当前玩家
+            opponent: 对手玩家
+            hud_rect: 区域在屏幕上的位置
+
+        Returns:
+            与hud_rect同尺寸的surface
+        """
+        state = self._hud_state(current, opponent)
+        if state == self._last_hud_state:
+            return self._hud_surface
+
+        hud = self._background.subsurface(hud_rect).copy()
+        offset_y = hud_rect.y
+        blit_list = []
 
         # 当前玩家信息（左侧）
-        if self.medium_font and self.screen:
-            try:
-                player_name = self.medium_font.render(f"{current.name}", True, self.BLACK)
-            except:
-                player_name = self.medium_font.render("Player", True, self.BLACK)
-            self.screen.blit(player_name, (50, self.player_info_y))
+        if self.medium_font:
+            player_name = self._text(self.medium_font, current.name, self.BLACK, fallback="Player")
+            blit_list.append((player_name, (50, self.player_info_y - offset_y)))
 
-        if self.font and self.screen:
-            try:
-                player_health = self.font.render(f"生命值: {current.hero.health}/30 HP", True, self.RED)
-            except:
-                player_health = self.font.render(f"HP: {current.hero.health}/30", True, self.RED)
-            self.screen.blit(player_health, (50, self.player_info_y + 40))
+        if self.font:
+            player_health = self._text(self.font, f"生命值: {current.hero.health}/30 HP", self.RED,
+                                       fallback=f"HP: {current.hero.health}/30")
+            blit_list.append((player_health, (50, self.player_info_y + 40 - offset_y)))
 
         # 对手玩家信息（右侧）
-        if self.medium_font and self.screen:
-            try:
-                opponent_name = self.medium_font.render(f"{opponent.name}", True, self.BLACK)
-            except:
-                opponent_name = self.medium_font.render("Opponent", True, self.BLACK)
-            self.screen.blit(opponent_name, (self.width - 200, self.opponent_info_y))
+        if self.medium_font:
+            opponent_name = self._text(self.medium_font, opponent.name, self.BLACK, fallback="Opponent")
+            blit_list.append((opponent_name, (self.width - 200, self.opponent_info_y - offset_y)))
 
-        if self.font and self.screen:
-            try:
-                opponent_health = self.font.render(f"生命值: {opponent.hero.health}/30 HP", True, self.RED)
-            except:
-                opponent_health = self.font.render(f"HP: {opponent.hero.health}/30", True, self.RED)
-            self.screen.blit(opponent_health, (self.width - 200, self.opponent_info_y + 40))
+        if self.font:
+            opponent_health = self._text(self.font, f"生命值: {opponent.hero.health}/30 HP", self.RED,
+                                         fallback=f"HP: {opponent.hero.health}/30")
+            blit_list.append((opponent_health, (self.width - 200, self.opponent_info_y + 40 - offset_y)))
 
         # 法力值显示
         mana_text = f"法力值: {current.current_mana}/{current.max_mana}"
         mana_bar_width = min(250, self.width // 3)
         mana_bar_height = 25
         mana_bar_x = 50
-        mana_bar_y = self.mana_bar_y
+        mana_bar_y = self.mana_bar_y - offset_y
 
         # 法力值背景条
-        pygame.draw.rect(self.screen, self.DARK_GRAY,
+        pygame.draw.rect(hud, self.DARK_GRAY,
                         (mana_bar_x, mana_bar_y, mana_bar_width, mana_bar_height))
 
         # 当前法力值条
         current_mana_width = int((current.current_mana / current.max_mana) * mana_bar_width)
-        pygame.draw.rect(self.screen, self.BLUE,
+        pygame.draw.rect(hud, self.BLUE,
                         (mana_bar_x, mana_bar_y, current_mana_width, mana_bar_height))
 
         # 法力值文字
-        if self.font and self.screen:
-            try:
-                mana_text_render = self.font.render(mana_text, True, self.BLACK)
-            except:
-                mana_text_render = self.font.render(mana_text, True, self.BLACK)
-            self.screen.blit(mana_text_render, (mana_bar_x, mana_bar_y - 35))
+        if self.font:
+            mana_text_render = self._text(self.font, mana_text, self.BLACK)
+            blit_list.append((mana_text_render, (mana_bar_x, mana_bar_y - 35)))
+
+        # 这些文字互不重叠，也不压在法力条上，统一用一次blits绘制
+        hud.blits(blit_list, doreturn=False)
+
+        self._hud_surface = hud
+        self._last_hud_state = state
+        return hud
+
+    def render_game_state(self, game):
+        """
+        重写游戏状态渲染，添加AI支持
+
+        不变的底图只绘制一次；之后每帧只重绘状态发生变化的区域，
+        绘制时用裁剪区域限制在这些区域内，并只把它们提交给 pygame.display.update。
+        首帧、窗口尺寸变化或脏区域超过屏幕40%时整屏绘制并flip。
+        """
+        if not self.screen:
+            return
+
+        layout_key = (self.screen, self.width, self.height, self.card_spacing)
+        full_redraw = layout_key != self._layout_key
+        if full_redraw:
+            self._build_background()
+            self._layout_key = layout_key
+
+        message = self.ai_action_message
+        if not (message and self.ai_message_remaining_ms > 0):
+            message = None
+        state = self._frame_state(game, message)
+        prev_state = self._prev_state
+        self._prev_state = {key: desc for key, (_, desc) in state.items()}
+
+        if not full_redraw:
+            changed = [key for key, (_, desc) in state.items() if prev_state.get(key) != desc]
+            if not changed:
+                return
+            dirty = [state[key][0] for key in changed if state[key][0] is not None]
+            if 'message' in changed and self._message_rect is not None:
+                # 旧消息框所在位置也要重绘
+                dirty.append(self._message_rect)
+            self._message_rect = state['message'][0]
+
+            area = sum(rect.width * rect.height for rect in dirty)
+            if area <= self.width * self.height * 0.4:
+                self.screen.set_clip(dirty[0].unionall(dirty[1:]))
+                self._draw_frame(game, message)
+                self.screen.set_clip(None)
+                pygame.display.update(dirty)
+                return
+
+        self._message_rect = state['message'][0]
+        self._draw_frame(game, message)
+        pygame.display.flip()
+
+    def _draw_frame(self, game, message):
+        """在背景上绘制整帧游戏画面（不提交显示）"""
+        # 用预先绘制好的底图清屏
+        self.screen.blit(self._background, (0, 0))
+
+        current = game.current_player
+        opponent = game.opponent
+
+        # 绘制标题
+        if self.large_font:
+            title_surface = self._text(self.large_font, self._title_text(game), self.WHITE,
+                                       fallback=f"Turn {game.turn_number} - {current.name}")
+            title_rect = title_surface.get_rect(center=(self.width // 2, 35))
+            self.screen.blit(title_surface, title_rect)
+
+        # 玩家信息和法力条
+        hud_rect = self._hud_rect()
+        self.screen.blit(self._get_hud_surface(current, opponent, hud_rect), hud_rect)
 
         # 手牌显示区域背景
         hand_area_bg = pygame.Rect(0, self.hand_area_y - 50, self.width, 220)
@@ -160,58 +432,35 @@ class EnhancedPygameRenderer(PygameRenderer):
         self._render_battlefield(opponent.battlefield, (50, self.opponent_battlefield_y), "对手战场")
 
         # 显示AI操作消息
-        if self.ai_action_message and pygame.time.get_ticks() < self.ai_message_timer:
-            if self.small_font and self.screen:
-                try:
-                    message_surface = self.small_font.render(self.ai_action_message, True, self.ORANGE)
-                    message_rect = message_surface.get_rect(center=(self.width // 2, self.height // 2))
+        box = self._message_box(message)
+        if box:
+            message_surface, message_rect, bg_rect = box
 
-                    # 绘制消息背景
-                    bg_rect = message_rect.inflate(20, 10)
-                    pygame.draw.rect(self.screen, self.BLACK, bg_rect)
-                    pygame.draw.rect(self.screen, self.ORANGE, bg_rect, 2)
+            # 绘制消息背景
+            pygame.draw.rect(self.screen, self.BLACK, bg_rect)
+            pygame.draw.rect(self.screen, self.ORANGE, bg_rect, 2)
 
-                    self.screen.blit(message_surface, message_rect)
-                except:
-                    pass
-
-        # 操作提示区域
-        instructions_bg = pygame.Rect(0, self.height - 60, self.width, 60)
-        pygame.draw.rect(self.screen, self.DARK_GRAY, instructions_bg)
-
-        # 操作提示
-        if self.small_font and self.screen:
-            try:
-                instructions = "鼠标: 左键选择/出牌, 右键取消 | 键盘: ←→选择, 空格选中, 回车出牌 | 按键: N-结束回合, ESC-退出"
-                instructions_text = self.small_font.render(instructions, True, self.WHITE)
-            except:
-                instructions = "Mouse: Left-Select/Play, Right-Cancel | Keys: ←→Select, Space-Select, Enter-Play | Keys: N-End Turn, ESC-Exit"
-                instructions_text = self.small_font.render(instructions, True, self.WHITE)
-            instructions_rect = instructions_text.get_rect(center=(self.width // 2, self.height - 30))
-            self.screen.blit(instructions_text, instructions_rect)
+            self.screen.blit(message_surface, message_rect)
 
-        # 更新显示
-        pygame.display.flip()
+        # 操作提示栏画在最上层，从底图恢复
+        self.screen.blit(self._background, self._instructions_rect, self._instructions_rect)
 
     def _render_hand(self, hand, position):
         """重写手牌渲染，支持高亮"""
         x, y = position
         if self.font and self.screen:
-            try:
-                hand_title = self.font.render("手牌:", True, self.BLACK)
-            except:
-                hand_title = self.font.render("Hand:", True, self.BLACK)
+            hand_title = self._text(self.font, "手牌:", self.BLACK, fallback="Hand:")
             self.screen.blit(hand_title, (x, y - 40))
 
-        # 计算手牌位置以防止重叠
+        # 计算手牌位置以防止重叠；按下标遍历，不复制手牌列表
         max_displayed_cards = min(len(hand), self.max_cards_per_row)
-        displayed_hand = hand[:max_displayed_cards]
 
-        for i, card in enumerate(displayed_hand):
+        for i in range(max_displayed_cards):
+            card = hand[i]
             card_x = x + i * self.card_spacing
 
             # 检查是否需要高亮
-            is_highlighted = card in self.highlighted_cards
+            is_highlighted = id(card) in self.highlighted_cards
 
             # 如果是选中的卡牌，稍微抬高一些
             card_y = y - 25 if (self.selected_card and i == self.selected_card_index) else y
@@ -224,14 +473,39 @@ class EnhancedPygameRenderer(PygameRenderer):
 
     def show_ai_action_result(self, action: str, card_name: str = None, success: bool = True):
         """显示AI操作结果"""
-        if success:
-            self.set_ai_action_message(f"✅ AI {action}: {card_name}")
-        else:
-            self.set_ai_action_message(f"❌ AI {action} 失败: {card_name}")
+        self.set_ai_action_message(_ai_action_msg(action, card_name, success))
+
+
+def _ai_play_queues(hand):
+    """
+    按AI出牌优先级为手牌建堆
+
+    随从按攻击力从高到低，其它卡牌按费用从低到高，同分时按手牌顺序。
+
+    Returns:
+        (随从堆, 其它卡牌堆)，元素为 (排序键, 手牌位置, 卡牌)
+    """
+    minions = [(-card.attack, i, card) for i, card in enumerate(hand) if card.card_type is _MINION]
+    others = [(card.cost, i, card) for i, card in enumerate(hand) if card.card_type is not _MINION]
+    heapq.heapify(minions)
+    heapq.heapify(others)
+    return minions, others
+
+
+def _has_affordable(queue, mana):
+    """弹掉堆顶买不起的卡牌（AI回合内法力只减不增），返回堆里是否还有可出的卡牌"""
+    while queue and queue[0][2].cost > mana:
+        heapq.heappop(queue)
+    return bool(queue)
 
 
 def ai_turn_enhanced(engine, game, renderer):
-    """增强版AI回合 - 带动画和视觉反馈"""
+    """
+    增强版AI回合 - 带动画和视觉反馈
+
+    Raises:
+        _QuitRequested: 动画等待期间用户请求退出
+    """
     current = game.current_player
     print(f"\n🤖 {current.name}的回合开始！")
 
@@ -241,41 +515,44 @@ def ai_turn_enhanced(engine, game, renderer):
     renderer.update_display()
 
     # 模拟AI思考时间
-    time.sleep(1.5)
+    renderer._wait_animated(1500, game)
 
     # AI出牌阶段
     cards_played = 0
     max_plays = 3
 
+    minion_queue, other_queue = _ai_play_queues(current.hand)
+    hand_size = len(current.hand)
+
     while cards_played < max_plays and current.current_mana > 0:
-        playable_cards = [card for card in current.hand if card.cost <= current.current_mana]
+        mana = current.current_mana
 
-        if not playable_cards:
+        # AI选择策略：优先高攻击力随从，没有可出的随从时出最便宜的其它卡牌
+        queue = minion_queue if _has_affordable(minion_queue, mana) else other_queue
+        if not _has_affordable(queue, mana):
             renderer.set_ai_action_message("💭 AI没有可出的卡牌了")
             break
-
-        # AI选择策略：优先高攻击力随从
-        if any(card.card_type == CardType.MINION for card in playable_cards):
-            minion_cards = [card for card in playable_cards if card.card_type == CardType.MINION]
-            minion_cards.sort(key=lambda x: x.attack, reverse=True)
-            card = minion_cards[0]
-        else:
-            playable_cards.sort(key=lambda x: x.cost)
-            card = playable_cards[0]
+        card = heapq.heappop(queue)[2]
 
         # 高亮AI选择的卡牌
         renderer.highlight_card(card, True)
         renderer.set_ai_action_message(f"🤖 AI选择打出 {card.name} (费用:{card.cost})")
         renderer.render_game_state(game)
         renderer.update_display()
-        time.sleep(1)
+        renderer._wait_animated(1000, game)
 
         # 执行出牌
         result = engine.play_card(card)
         if result.success:
             renderer.show_ai_action_result("出牌", card.name, True)
             cards_played += 1
-            time.sleep(1)
+
+            # 卡牌效果抽了牌时手牌有新增，重新建堆
+            hand_size -= 1
+            if len(current.hand) != hand_size:
+                minion_queue, other_queue = _ai_play_queues(current.hand)
+                hand_size = len(current.hand)
+            renderer._wait_animated(1000, game)
         else:
             renderer.show_ai_action_result("出牌", card.name, False)
             break
@@ -289,7 +566,7 @@ def ai_turn_enhanced(engine, game, renderer):
         renderer.set_ai_action_message("⚔️ AI考虑攻击...")
         renderer.render_game_state(game)
         renderer.update_display()
-        time.sleep(1)
+        renderer._wait_animated(1000, game)
 
         for attacker in attackable_minions[:2]:  # 最多攻击2次
             targets = [game.opponent.hero] + game.opponent.battlefield
@@ -298,7 +575,7 @@ def ai_turn_enhanced(engine, game, renderer):
                 renderer.set_ai_action_message(f"⚔️ {attacker.name} 攻击 {target.name if hasattr(target, 'name') else '英雄'}")
                 renderer.render_game_state(game)
                 renderer.update_display()
-                time.sleep(1)
+                renderer._wait_animated(1000, game)
 
                 result = engine.attack_with_minion(attacker, target)
                 if result.success:
@@ -311,7 +588,7 @@ def ai_turn_enhanced(engine, game, renderer):
     renderer.set_ai_action_message(f"🔄 {current.name}结束回合")
     renderer.render_game_state(game)
     renderer.update_display()
-    time.sleep(1)
+    renderer._wait_animated(1000, game)
     engine.end_turn()
 
     # 隐藏AI思考状态
@@ -355,7 +632,10 @@ def main():
 
         # AI模式处理
         if game.current_player.name == "AI电脑":
-            ai_turn_enhanced(engine, game, renderer)
+            try:
+                ai_turn_enhanced(engine, game, renderer)
+            except _QuitRequested:
+                break
             engine.start_turn()
 
         # 检查游戏是否结束
@@ -365,15 +645,12 @@ def main():
             break
 
         # 处理事件（允许用户交互）
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        for event in _drain_events():
+            if _is_quit(event):
                 running = False
                 break
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-                    break
-                elif event.key == pygame.K_n and game.current_player.name == "玩家":  # 玩家结束回合
+                if event.key == pygame.K_n and game.current_player.name == "玩家":  # 玩家结束回合
                     print(f"🔄 {game.current_player.name} 结束回合")
                     engine.end_turn()
                     engine.start_turn()
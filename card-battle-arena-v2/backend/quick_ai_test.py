@@ -4,6 +4,7 @@
 验证AI对战功能是否正常工作
 """
 
+import argparse
 import sys
 import time
 from pathlib import Path
@@ -13,10 +14,9 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 try:
     import pygame
-    pygame.init()
 except ImportError:
-    print("错误：未安装Pygame")
-    sys.exit(1)
+    # --no-gui 模式下只跑AI对战，不需要Pygame
+    pygame = None
 
 from app.game.engine import GameEngine
 from app.game.cards import Card, CardType
@@ -45,9 +45,9 @@ def quick_ai_battle():
 
             # AI出牌
             for _ in range(2):  # 最多出2张牌
-                playable_cards = [card for card in current.hand if card.cost <= current.current_mana]
-                if playable_cards:
-                    card = playable_cards[0]  # 选择第一张
+                # 选择第一张可出的牌
+                card = next((card for card in current.hand if card.cost <= current.current_mana), None)
+                if card is not None:
                     result = engine.play_card(card)
                     if result.success:
                         print(f"  ✅ AI打出 {card.name}")
@@ -100,6 +100,11 @@ def test_pygame_basic():
     """测试基本的Pygame功能"""
     print("\n🎮 测试基本Pygame功能")
 
+    if pygame is None:
+        print("错误：未安装Pygame")
+        return False
+    pygame.init()
+
     # 创建简单窗口
     screen = pygame.display.set_mode((400, 300))
     pygame.display.set_caption("AI对战测试")
@@ -135,9 +140,14 @@ def test_pygame_basic():
 
 def main():
     """主函数"""
+    parser = argparse.ArgumentParser(description="快速AI对战测试")
+    parser.add_argument("--no-gui", action="store_true",
+                        help="跳过Pygame窗口测试，只运行AI对战（不初始化SDL）")
+    args = parser.parse_args()
+
     try:
         # 测试基本Pygame功能
-        if not test_pygame_basic():
+        if not args.no_gui and not test_pygame_basic():
             print("❌ Pygame基本功能测试失败")
             return
 
@@ -146,17 +156,18 @@ def main():
 
         print("\n🎉 所有测试完成！")
         print("✅ AI对战功能工作正常")
-        print("✅ Pygame界面功能正常")
+        if not args.no_gui:
+            print("✅ Pygame界面功能正常")
 
     except KeyboardInterrupt:
         print("\n👋 测试被中断")
-        if pygame.get_init():
+        if pygame and pygame.get_init():
             pygame.quit()
     except Exception as e:
         print(f"❌ 测试出错: {e}")
         import traceback
         traceback.print_exc()
-        if pygame.get_init():
+        if pygame and pygame.get_init():
             pygame.quit()
 
 
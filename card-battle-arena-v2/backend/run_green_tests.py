@@ -5,8 +5,10 @@ TDD GREEN阶段测试运行器
 验证UI布局改进是否成功解决了RED阶段发现的问题。
 """
 
+import atexit
 import sys
 import pygame
+from functools import lru_cache
 from pathlib import Path
 
 # 添加项目路径
@@ -15,6 +17,25 @@ sys.path.insert(0, str(Path(__file__).parent))
 from app.visualization.improved_interactive_renderer import ImprovedInteractiveRenderer
 
 
+def _init_pygame():
+    """整个脚本只初始化一次pygame，退出时统一释放"""
+    if not pygame.get_init():
+        pygame.init()
+        atexit.register(pygame.quit)
+
+
+@lru_cache(maxsize=None)
+def _get_renderer(width=1200, height=800):
+    """
+    获取共用的ImprovedInteractiveRenderer
+
+    布局由构造参数决定，同一尺寸只创建一次。
+    只读取布局属性的测试共用它，会修改渲染器状态的测试应自己创建。
+    """
+    _init_pygame()
+    return ImprovedInteractiveRenderer(width, height)
+
+
 def run_green_test(test_name, test_func):
     """
     运行单个GREEN测试
@@ -38,8 +59,7 @@ def run_green_test(test_name, test_func):
 
 def test_improved_hand_area_height():
     """测试：改进的手牌区域高度"""
-    pygame.init()
-    renderer = ImprovedInteractiveRenderer(1200, 800)
+    renderer = _get_renderer()
 
     hand_area = renderer.player_hand
     hand_height = hand_area.size[1]
@@ -52,13 +72,10 @@ def test_improved_hand_area_height():
 
     print(f"    手牌区域高度: {hand_height}px (卡牌: {card_height}px + 操作空间: {min_required_space}px)")
 
-    pygame.quit()
-
 
 def test_game_controls_area_exists():
     """测试：游戏控制区域存在"""
-    pygame.init()
-    renderer = ImprovedInteractiveRenderer(1200, 800)
+    renderer = _get_renderer()
 
     # 检查是否有游戏控制区域
     has_game_controls = hasattr(renderer, 'game_controls')
@@ -70,13 +87,10 @@ def test_game_controls_area_exists():
     if has_game_controls:
         assert renderer.game_controls is not None, "游戏控制区域应该正确初始化"
 
-    pygame.quit()
-
 
 def test_sufficient_card_interaction_space():
     """测试：充足的卡牌交互空间"""
-    pygame.init()
-    renderer = ImprovedInteractiveRenderer(1200, 800)
+    renderer = _get_renderer()
 
     hand_area = renderer.player_hand
     hand_height = hand_area.size[1]
@@ -92,13 +106,10 @@ def test_sufficient_card_interaction_space():
 
     print(f"    可用交互空间: {available_space}px (需要: {hover_space}px)")
 
-    pygame.quit()
-
 
 def test_end_turn_button_exists():
     """测试：结束回合按钮存在"""
-    pygame.init()
-    renderer = ImprovedInteractiveRenderer(1200, 800)
+    renderer = _get_renderer()
 
     # 检查是否有结束回合按钮
     has_end_turn_button = False
@@ -113,13 +124,10 @@ def test_end_turn_button_exists():
         button_rect = renderer.game_controls.rect
         assert button_rect.width > 0 and button_rect.height > 0, "结束回合按钮应该有正确的尺寸"
 
-    pygame.quit()
-
 
 def test_layout_space_allocation():
     """测试：合理的布局空间分配"""
-    pygame.init()
-    renderer = ImprovedInteractiveRenderer(1200, 800)
+    renderer = _get_renderer()
 
     # 检查改进后的布局空间分配
     hud_height = renderer.hud.size[1]
@@ -136,13 +144,10 @@ def test_layout_space_allocation():
     print(f"    手牌高度: {hand_height}px")
     print(f"    总使用: {total_used}px")
 
-    pygame.quit()
-
 
 def test_player_info_display_exists():
     """测试：玩家信息显示存在"""
-    pygame.init()
-    renderer = ImprovedInteractiveRenderer(1200, 800)
+    renderer = _get_renderer()
 
     # 检查是否有玩家信息显示
     has_player_info = hasattr(renderer, 'player_info_display')
@@ -150,12 +155,11 @@ def test_player_info_display_exists():
     # 这应该PASS，因为改进后添加了玩家信息显示
     assert has_player_info, "应该有玩家信息显示区域"
 
-    pygame.quit()
-
 
 def test_improved_layout_functionality():
     """测试：改进布局的功能性"""
-    pygame.init()
+    # initialize_game会重建UI组件，不能用共用的渲染器
+    _init_pygame()
     renderer = ImprovedInteractiveRenderer(1200, 800)
 
     # 测试游戏是否能正常初始化
@@ -170,8 +174,6 @@ def test_improved_layout_functionality():
     assert renderer.player_battlefield is not None, "玩家战场组件应该存在"
     assert renderer.opponent_battlefield is not None, "对手战场组件应该存在"
 
-    pygame.quit()
-
 
 def main():
     """运行所有GREEN测试"""
@@ -5,8 +5,10 @@ TDD RED阶段测试运行器
 运行UI布局改进的RED测试，验证当前布局的问题。
 """
 
+import atexit
 import sys
 import pygame
+from functools import lru_cache
 from pathlib import Path
 
 # 添加项目路径
@@ -16,6 +18,25 @@ from app.visualization.interactive_renderer import InteractiveRenderer
 from app.game.cards import Card, CardType
 
 
+def _init_pygame():
+    """整个脚本只初始化一次pygame，退出时统一释放"""
+    if not pygame.get_init():
+        pygame.init()
+        atexit.register(pygame.quit)
+
+
+@lru_cache(maxsize=None)
+def _get_renderer(width=1200, height=800):
+    """
+    获取共用的InteractiveRenderer
+
+    布局由构造参数决定，同一尺寸只创建一次。
+    只读取布局属性的测试共用它，会修改渲染器状态的测试应自己创建。
+    """
+    _init_pygame()
+    return InteractiveRenderer(width, height)
+
+
 def run_red_test(test_name, test_func):
     """
     运行单个RED测试
@@ -39,8 +60,7 @@ def run_red_test(test_name, test_func):
 
 def test_current_hand_area_insufficient_height():
     """测试：当前手牌区域高度不足"""
-    pygame.init()
-    renderer = InteractiveRenderer(1200, 800)
+    renderer = _get_renderer()
 
     hand_area = renderer.player_hand
     hand_height = hand_area.size[1]
@@ -49,13 +69,10 @@ def test_current_hand_area_insufficient_height():
     # 这应该FAIL，因为150 < 160
     assert hand_height >= card_height, f"手牌区域高度{hand_height}px不足以容纳卡牌高度{card_height}px"
 
-    pygame.quit()
-
 
 def test_missing_game_controls_area():
     """测试：缺少游戏控制区域"""
-    pygame.init()
-    renderer = InteractiveRenderer(1200, 800)
+    renderer = _get_renderer()
 
     # 检查是否有游戏控制区域
     has_game_controls = hasattr(renderer, 'game_controls')
@@ -63,13 +80,10 @@ def test_missing_game_controls_area():
     # 这应该FAIL，因为当前没有游戏控制区域
     assert has_game_controls, "缺少专门的游戏控制区域"
 
-    pygame.quit()
-
 
 def test_insufficient_card_interaction_space():
     """测试：卡牌交互空间不足"""
-    pygame.init()
-    renderer = InteractiveRenderer(1200, 800)
+    renderer = _get_renderer()
 
     hand_area = renderer.player_hand
     hand_height = hand_area.size[1]
@@ -82,13 +96,10 @@ def test_insufficient_card_interaction_space():
     # 这应该FAIL，因为可用空间不足
     assert available_space >= hover_space, f"卡牌交互空间{available_space}px不足，需要至少{hover_space}px"
 
-    pygame.quit()
-
 
 def test_no_end_turn_button():
     """测试：没有结束回合按钮"""
-    pygame.init()
-    renderer = InteractiveRenderer(1200, 800)
+    renderer = _get_renderer()
 
     # 检查是否有结束回合按钮
     has_end_turn_button = hasattr(renderer, 'end_turn_button')
@@ -96,13 +107,10 @@ def test_no_end_turn_button():
     # 这应该FAIL，因为当前没有结束回合按钮
     assert has_end_turn_button, "缺少结束回合按钮"
 
-    pygame.quit()
-
 
 def test_layout_space_allocation():
     """测试：布局空间分配问题"""
-    pygame.init()
-    renderer = InteractiveRenderer(1200, 800)
+    renderer = _get_renderer()
 
     # 检查当前布局的空间分配
     hud_height = renderer.hud.size[1]
@@ -112,8 +120,6 @@ def test_layout_space_allocation():
     total_used = hud_height + hand_height
     assert total_used <= 220, f"当前HUD+手牌使用了{total_used}px空间，分配不合理"
 
-    pygame.quit()
-
 
 def main():
     """运行所有RED测试"""
@@ -0,0 +1,39 @@
+"""
+增强版命令行演示测试
+
+验证关闭动画后演示流程不再等待。
+"""
+
+import sys
+import os
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import enhanced_demo
+from app.game.engine import GameEngine
+
+
+class TestNoAnimate:
+    """关闭动画测试"""
+
+    def test_hero_power_does_not_sleep(self, monkeypatch):
+        """关闭动画时使用英雄技能不调用time.sleep"""
+        monkeypatch.setattr(enhanced_demo, 'ANIMATE', False)
+
+        def fail_sleep(seconds):
+            raise AssertionError(f"关闭动画时不应等待 {seconds} 秒")
+
+        monkeypatch.setattr(enhanced_demo.time, 'sleep', fail_sleep)
+
+        engine = GameEngine()
+        game = engine.create_game("玩家", "AI电脑")
+        engine.start_turn()
+        current = game.current_player
+        current.max_mana = current.current_mana = 2
+        opponent_health = game.opponent.hero.health
+
+        enhanced_demo.use_hero_power_interactive(engine, game)
+
+        assert current.used_hero_power
+        assert game.opponent.hero.health == opponent_health - 1
@@ -272,6 +272,49 @@ class TestCombat:
         assert not result.success
         assert "cannot attack this turn" in result.error.lower()
 
+    def test_attacker_must_be_same_minion_on_battlefield(self):
+        """测试属性相同但不是同一对象的随从不被视为在战场上"""
+        engine = GameEngine()
+        game = engine.create_game("Player1", "Player2")
+
+        minion = Card(17, "Twin", 1, 1, 1, CardType.MINION)
+        minion.can_attack = True
+        twin = Card(17, "Twin", 1, 1, 1, CardType.MINION)
+        twin.can_attack = True
+        game.current_player.battlefield.append(minion)
+
+        assert game.current_player.contains_minion(minion)
+        assert not game.current_player.contains_minion(twin)
+
+        result = engine.attack_with_minion(twin, target=game.opponent.hero)
+        assert not result.success
+        assert "not on battlefield" in result.error.lower()
+
+    def test_attack_result_reports_deaths(self):
+        """测试攻击结果携带双方阵亡信息"""
+        engine = GameEngine()
+        game = engine.create_game("Player1", "Player2")
+
+        attacker = Card(18, "Attacker", 2, 3, 2, CardType.MINION)
+        attacker.can_attack = True
+        game.current_player.battlefield.append(attacker)
+        defender = Card(19, "Defender", 2, 2, 3, CardType.MINION)
+        game.opponent.battlefield.append(defender)
+
+        result = engine.attack_with_minion(attacker, target=defender)
+        assert result.success
+        assert result.target_died
+        assert result.attacker_died
+
+        survivor = Card(20, "Survivor", 1, 1, 5, CardType.MINION)
+        survivor.can_attack = True
+        game.current_player.battlefield.append(survivor)
+
+        result = engine.attack_with_minion(survivor, target=game.opponent.hero)
+        assert result.success
+        assert not result.target_died
+        assert not result.attacker_died
+
     def test_taunt_mechanic(self):
         """测试嘲讽机制"""
         engine = GameEngine()
@@ -301,6 +344,17 @@ class TestCombat:
 class TestGameRules:
     """游戏规则测试"""
 
+    def test_seeded_rng_reproduces_shuffle(self):
+        """测试传入相同种子的随机数生成器时洗牌结果一致"""
+        import random
+
+        game_a = GameEngine(random.Random(42)).create_game("Player1", "Player2")
+        game_b = GameEngine(random.Random(42)).create_game("Player1", "Player2")
+
+        for player_a, player_b in ((game_a.player1, game_b.player1), (game_a.player2, game_b.player2)):
+            assert [c.id for c in player_a.hand] == [c.id for c in player_b.hand]
+            assert [c.id for c in player_a.deck] == [c.id for c in player_b.deck]
+
     def test_win_condition_hero_death(self):
         """测试英雄死亡时的胜负判定"""
         engine = GameEngine()
@@ -88,6 +88,21 @@ class TestComponentizedCardRenderer:
         # 验证渲染方法被调用
         assert mock_surface.blit.called
 
+    def test_card_surface_cached_until_stats_change(self):
+        """测试卡面缓存：显示属性不变时复用，属性变化后重新绘制"""
+        from app.visualization.components.card_renderer import CardRenderer
+        from app.game.cards import Card, CardType
+
+        card = Card(1, "测试卡牌", 3, 4, 5, CardType.MINION)
+        renderer = CardRenderer()
+
+        first = renderer.get_card_surface(card)
+        assert renderer.get_card_surface(card) is first
+        assert renderer.get_card_surface(card, selected=True) is not first
+
+        card.health -= 2
+        assert renderer.get_card_surface(card) is not first
+
     def test_card_highlight_states(self):
         """测试卡牌高亮状态"""
         from app.visualization.components.card_renderer import CardRenderer
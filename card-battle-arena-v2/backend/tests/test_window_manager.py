@@ -0,0 +1,108 @@
+"""
+窗口管理器测试
+
+验证动态布局计算与缓存行为。
+"""
+
+import sys
+import pygame
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.visualization.window_manager import WindowManager, WindowConfig, LayoutConfig, _calc_positions
+
+
+class TestCardPositions:
+    """卡牌位置计算测试"""
+
+    def test_positions_centered_in_region(self):
+        """卡牌在区域内水平居中且等距排列"""
+        manager = WindowManager()
+        layout = manager.layout_config
+        region = manager.get_layout_regions()['hand_area']
+
+        positions = manager.calculate_card_positions(3, 'hand_area')
+
+        assert len(positions) == 3
+        step = layout.card_width + layout.spacing
+        assert [x for x, _ in positions] == [positions[0][0] + i * step for i in range(3)]
+        total_width = 3 * layout.card_width + 2 * layout.spacing
+        assert positions[0][0] == region.x + (region.w - total_width) // 2
+
+    def test_overflow_does_not_mutate_spacing(self):
+        """手牌溢出时只在本次计算中收紧间距，不修改共享布局配置"""
+        manager = WindowManager(WindowConfig(width=800, height=800))
+        original_spacing = manager.layout_config.spacing
+
+        positions = manager.calculate_card_positions(10, 'hand_area')
+
+        assert len(positions) == 10
+        assert positions[1][0] - positions[0][0] < manager.layout_config.card_width + original_spacing
+        assert manager.layout_config.spacing == original_spacing
+
+    def test_positions_cached_per_shape(self):
+        """相同几何参数命中缓存，窗口尺寸变化后重新计算"""
+        manager = WindowManager()
+        first = manager.calculate_card_positions(4, 'hand_area')
+
+        hits = _calc_positions.cache_info().hits
+        assert manager.calculate_card_positions(4, 'hand_area') == first
+        assert _calc_positions.cache_info().hits == hits + 1
+
+        manager.window_config.width = 1600
+        manager._cache_valid = False
+        assert manager.calculate_card_positions(4, 'hand_area') != first
+
+    def test_unknown_region_returns_empty(self):
+        """未知区域返回空列表"""
+        manager = WindowManager()
+        assert manager.calculate_card_positions(3, 'unknown_region') == []
+
+
+class TestResize:
+    """窗口缩放测试"""
+
+    def test_resize_after_display_already_resized(self):
+        """显示surface已先被调整（pygame 2的VIDEORESIZE行为）时仍要更新布局"""
+        pygame.init()
+        try:
+            manager = WindowManager()
+            manager.create_window()
+            before = manager.get_layout_regions()['hand_area'].copy()
+
+            pygame.display.set_mode((1000, 700), pygame.RESIZABLE)
+            manager.handle_resize(1000, 700)
+
+            assert (manager.window_config.width, manager.window_config.height) == (1000, 700)
+            assert manager.get_layout_regions()['hand_area'] != before
+        finally:
+            pygame.quit()
+
+
+class TestWindowSize:
+    """窗口尺寸校验测试"""
+
+    def test_minimum_height_enforced(self):
+        """窗口高度低于布局所需最小值时无效"""
+        manager = WindowManager()
+        assert manager.is_valid_window_size(1200, 900)
+        assert not manager.is_valid_window_size(1200, 600)
+
+        width, height = manager.get_optimal_window_size(1200, 600)
+        assert width == 1200
+        assert manager.is_valid_window_size(width, height)
+
+    def test_update_layout_recomputes_minimum_height(self):
+        """修改布局配置后最小高度随之更新"""
+        manager = WindowManager()
+        assert manager.is_valid_window_size(1200, 900)
+
+        manager.update_layout(battlefield_height=400)
+        assert not manager.is_valid_window_size(1200, 900)
+        width, height = manager.get_optimal_window_size(1200, 900)
+        assert manager.is_valid_window_size(width, height)
+
+        manager.layout_config = LayoutConfig()
+        assert manager.is_valid_window_size(1200, 900)